@@ -1,3 +1,5 @@
+import collections
+import concurrent.futures
 import json
 import os
 import warnings
@@ -13,18 +15,26 @@ from keras_core.legacy.saving import saving_options
 from keras_core.legacy.saving import saving_utils
 from keras_core.saving import object_registration
 from keras_core.utils import io_utils
-
-try:
-    import h5py
-except ImportError:
-    h5py = None
-
+from keras_core.utils.module_utils import h5py
 
 HDF5_OBJECT_HEADER_LIMIT = 64512
+# Size of the raw data chunk cache used when reading H5 files. The h5py
+# default (1MB) is smaller than a single chunk of most large weights.
+HDF5_CHUNK_CACHE_BYTES = 64 * 1024 * 1024
+# Number of chunk slots in the cache hash table (a prime number, well above
+# the number of chunks that fit in the cache, to avoid collisions).
+HDF5_CHUNK_CACHE_SLOTS = 100003
+# Weights smaller than this are stored as a single chunk. Larger weights are
+# split along their leading axis into chunks of roughly
+# `HDF5_TARGET_CHUNK_BYTES`.
+HDF5_SINGLE_CHUNK_LIMIT = 16 * 1024 * 1024
+HDF5_TARGET_CHUNK_BYTES = 1024 * 1024
+# Number of threads reading layer weights ahead of their assignment.
+HDF5_READ_WORKERS = 8
 
 
 def save_model_to_hdf5(model, filepath, overwrite=True, include_optimizer=True):
-    if h5py is None:
+    if not h5py.available:
         raise ImportError(
             "`save_model()` using h5 format requires h5py. Could not "
             "import h5py."
@@ -99,7 +109,7 @@ def load_model_from_hdf5(filepath, custom_objects=None, compile=True):
         ImportError: if h5py is not available.
         ValueError: In case of an invalid savefile.
     """
-    if h5py is None:
+    if not h5py.available:
         raise ImportError(
             "`load_model()` using h5 format requires h5py. Could not "
             "import h5py."
@@ -114,7 +124,12 @@ def load_model_from_hdf5(filepath, custom_objects=None, compile=True):
 
     opened_new_file = not isinstance(filepath, h5py.File)
     if opened_new_file:
-        f = h5py.File(filepath, mode="r")
+        f = h5py.File(
+            filepath,
+            mode="r",
+            rdcc_nbytes=HDF5_CHUNK_CACHE_BYTES,
+            rdcc_nslots=HDF5_CHUNK_CACHE_SLOTS,
+        )
     else:
         f = filepath
 
@@ -235,7 +250,12 @@ def save_subset_weights_to_hdf5_group(f, weights):
     weight_names = [w.name.encode("utf8") for w in weights]
     save_attributes_to_hdf5_group(f, "weight_names", weight_names)
     for name, val in zip(weight_names, weight_values):
-        param_dset = f.create_dataset(name, val.shape, dtype=val.dtype)
+        param_dset = f.create_dataset(
+            name,
+            val.shape,
+            dtype=val.dtype,
+            chunks=get_chunk_shape(val.shape, val.dtype),
+        )
         if not val.shape:
             # scalar
             param_dset[()] = val
@@ -263,7 +283,10 @@ def save_optimizer_weights_to_hdf5_group(hdf5_group, optimizer):
         weight_values = [backend.convert_to_numpy(w) for w in symbolic_weights]
         for name, val in zip(weight_names, weight_values):
             param_dset = weights_group.create_dataset(
-                name, val.shape, dtype=val.dtype
+                name,
+                val.shape,
+                dtype=val.dtype,
+                chunks=get_chunk_shape(val.shape, val.dtype),
             )
             if not val.shape:
                 # scalar
@@ -272,6 +295,33 @@ def save_optimizer_weights_to_hdf5_group(hdf5_group, optimizer):
                 param_dset[:] = val
 
 
+def get_chunk_shape(shape, dtype):
+    """Picks the HDF5 chunk shape used to store a weight.
+
+    Weights smaller than `HDF5_SINGLE_CHUNK_LIMIT` are stored as a single
+    chunk. Larger weights are chunked along their leading axis, with chunks
+    of about `HDF5_TARGET_CHUNK_BYTES`, so that they can be read sequentially
+    without thrashing the chunk cache.
+
+    Args:
+        shape: Shape of the weight.
+        dtype: Dtype of the weight.
+
+    Returns:
+        The chunk shape, or `None` if the weight should not be chunked
+        (scalars and empty weights).
+    """
+    shape = tuple(shape)
+    if not shape or 0 in shape:
+        return None
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    if nbytes < HDF5_SINGLE_CHUNK_LIMIT:
+        return shape
+    row_bytes = nbytes // shape[0]
+    rows = max(1, HDF5_TARGET_CHUNK_BYTES // row_bytes)
+    return (min(rows, shape[0]),) + shape[1:]
+
+
 def save_attributes_to_hdf5_group(group, name, data):
     """Saves attributes (data) of the specified name into the HDF5 group.
 
@@ -316,25 +366,28 @@ def save_attributes_to_hdf5_group(group, name, data):
         group.attrs[name] = data
 
 
-def load_weights_from_hdf5_group(f, model):
+def load_weights_from_hdf5_group(f, model, attrs=None):
     """Implements topological (order-based) weight loading.
 
     Args:
         f: A pointer to a HDF5 group.
         model: Model instance.
+        attrs: Optional dict of the attributes of `f`, if already read.
 
     Raises:
         ValueError: in case of mismatch between provided layers
             and weights file.
     """
-    if "keras_version" in f.attrs:
-        original_keras_version = f.attrs["keras_version"]
+    if attrs is None:
+        attrs = dict(f.attrs)
+    if "keras_version" in attrs:
+        original_keras_version = attrs["keras_version"]
         if hasattr(original_keras_version, "decode"):
             original_keras_version = original_keras_version.decode("utf8")
     else:
         original_keras_version = "1"
-    if "backend" in f.attrs:
-        original_backend = f.attrs["backend"]
+    if "backend" in attrs:
+        original_backend = attrs["backend"]
         if hasattr(original_backend, "decode"):
             original_backend = original_backend.decode("utf8")
     else:
@@ -346,7 +399,7 @@ def load_weights_from_hdf5_group(f, model):
         if weights:
             filtered_layers.append(layer)
 
-    layer_names = load_attributes_from_hdf5_group(f, "layer_names")
+    layer_names = load_attributes_from_hdf5_group(f, "layer_names", attrs=attrs)
     filtered_layer_names = []
     for name in layer_names:
         g = f[name]
@@ -361,11 +414,12 @@ def load_weights_from_hdf5_group(f, model):
             f"{len(layer_names)} saved layers."
         )
 
-    for k, name in enumerate(layer_names):
-        g = f[name]
+    all_weight_values = _read_subsets_ahead(f[name] for name in layer_names)
+    for k, (name, weight_values) in enumerate(
+        zip(layer_names, all_weight_values)
+    ):
         layer = filtered_layers[k]
         symbolic_weights = _legacy_weights(layer)
-        weight_values = load_subset_weights_from_hdf5_group(g)
         if len(weight_values) != len(symbolic_weights):
             raise ValueError(
                 f"Weight count mismatch for layer #{k} (named {layer.name} in "
@@ -397,7 +451,9 @@ def load_weights_from_hdf5_group(f, model):
             ref_v.assign(val)
 
 
-def load_weights_from_hdf5_group_by_name(f, model, skip_mismatch=False):
+def load_weights_from_hdf5_group_by_name(
+    f, model, skip_mismatch=False, attrs=None
+):
     """Implements name-based weight loading (instead of topological loading).
 
     Layers that have no matching name are skipped.
@@ -408,26 +464,29 @@ def load_weights_from_hdf5_group_by_name(f, model, skip_mismatch=False):
         skip_mismatch: Boolean, whether to skip loading of layers
             where there is a mismatch in the number of weights,
             or a mismatch in the shape of the weights.
+        attrs: Optional dict of the attributes of `f`, if already read.
 
     Raises:
         ValueError: in case of mismatch between provided layers
             and weights file and skip_match=False.
     """
-    if "keras_version" in f.attrs:
-        original_keras_version = f.attrs["keras_version"]
+    if attrs is None:
+        attrs = dict(f.attrs)
+    if "keras_version" in attrs:
+        original_keras_version = attrs["keras_version"]
         if hasattr(original_keras_version, "decode"):
             original_keras_version = original_keras_version.decode("utf8")
     else:
         original_keras_version = "1"
-    if "backend" in f.attrs:
-        original_backend = f.attrs["backend"]
+    if "backend" in attrs:
+        original_backend = attrs["backend"]
         if hasattr(original_backend, "decode"):
             original_backend = original_backend.decode("utf8")
     else:
         original_backend = None
 
     # New file format.
-    layer_names = load_attributes_from_hdf5_group(f, "layer_names")
+    layer_names = load_attributes_from_hdf5_group(f, "layer_names", attrs=attrs)
 
     # Reverse index of layer name to list of layers with name.
     index = {}
@@ -435,10 +494,11 @@ def load_weights_from_hdf5_group_by_name(f, model, skip_mismatch=False):
         if layer.name:
             index.setdefault(layer.name, []).append(layer)
 
-    for k, name in enumerate(layer_names):
-        g = f[name]
-        weight_values = load_subset_weights_from_hdf5_group(g)
-        for layer in index.get(name, []):
+    # Only the groups of layers of the model are read, ahead of assignment.
+    matched = [(k, name) for k, name in enumerate(layer_names) if name in index]
+    all_weight_values = _read_subsets_ahead(f[name] for _, name in matched)
+    for (k, name), weight_values in zip(matched, all_weight_values):
+        for layer in index[name]:
             symbolic_weights = _legacy_weights(layer)
             if len(weight_values) != len(symbolic_weights):
                 if skip_mismatch:
@@ -546,7 +606,28 @@ def load_subset_weights_from_hdf5_group(f):
             and weights file.
     """
     weight_names = load_attributes_from_hdf5_group(f, "weight_names")
-    return [np.asarray(f[weight_name]) for weight_name in weight_names]
+    return [read_dataset(f[weight_name]) for weight_name in weight_names]
+
+
+def _read_subsets_ahead(groups):
+    """Yields the weight values of each of `groups`, in order.
+
+    Up to `HDF5_READ_WORKERS` groups are read ahead in background threads,
+    so that reading the weights of the next layers overlaps with assigning
+    the current ones.
+    """
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=HDF5_READ_WORKERS
+    ) as executor:
+        pending = collections.deque()
+        for group in groups:
+            pending.append(
+                executor.submit(load_subset_weights_from_hdf5_group, group)
+            )
+            if len(pending) > HDF5_READ_WORKERS:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 def load_optimizer_weights_from_hdf5_group(hdf5_group):
@@ -563,11 +644,30 @@ def load_optimizer_weights_from_hdf5_group(hdf5_group):
         weights_group, "weight_names"
     )
     return [
-        weights_group[weight_name] for weight_name in optimizer_weight_names
+        read_dataset(weights_group[weight_name])
+        for weight_name in optimizer_weight_names
     ]
 
 
-def load_attributes_from_hdf5_group(group, name):
+def read_dataset(dataset):
+    """Reads a HDF5 dataset into a NumPy array.
+
+    The values are read with `read_direct()` into a preallocated array,
+    which is much faster than `np.asarray(dataset)` on chunked datasets.
+
+    Args:
+        dataset: A HDF5 dataset.
+
+    Returns:
+        NumPy array holding the values of the dataset.
+    """
+    value = np.empty(dataset.shape, dtype=dataset.dtype)
+    if value.size:
+        dataset.read_direct(value)
+    return value
+
+
+def load_attributes_from_hdf5_group(group, name, attrs=None):
     """Loads attributes of the specified name from the HDF5 group.
 
     This method deals with an inherent problem
@@ -577,23 +677,25 @@ def load_attributes_from_hdf5_group(group, name):
     Args:
         group: A pointer to a HDF5 group.
         name: A name of the attributes to load.
+        attrs: Optional dict of the attributes of `group`, if already read.
 
     Returns:
         data: Attributes data.
     """
-    if name in group.attrs:
+    if attrs is None:
+        attrs = group.attrs
+    if name in attrs:
         data = [
-            n.decode("utf8") if hasattr(n, "decode") else n
-            for n in group.attrs[name]
+            n.decode("utf8") if hasattr(n, "decode") else n for n in attrs[name]
         ]
     else:
         data = []
         chunk_id = 0
-        while f"{name}{chunk_id}" in group.attrs:
+        while f"{name}{chunk_id}" in attrs:
             data.extend(
                 [
                     n.decode("utf8") if hasattr(n, "decode") else n
-                    for n in group.attrs[f"{name}{chunk_id}"]
+                    for n in attrs[f"{name}{chunk_id}"]
                 ]
             )
             chunk_id += 1
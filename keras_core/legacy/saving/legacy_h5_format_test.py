@@ -481,3 +481,121 @@ class LegacyH5BackwardsCompatTest(testing.TestCase):
 
         # Compare output
         self.assertAllClose(ref_output, output, atol=1e-5)
+
+
+class LegacyH5UtilsTest(testing.TestCase):
+    def test_read_dataset(self):
+        import h5py
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "data.h5")
+        values = {
+            "scalar": np.array(3.0, dtype="float32"),
+            "matrix": np.random.random((4, 5)),
+            "empty": np.zeros((0, 3), dtype="int32"),
+        }
+        with h5py.File(temp_filepath, "w") as f:
+            for name, value in values.items():
+                f.create_dataset(name, data=value)
+        with h5py.File(temp_filepath, "r") as f:
+            for name, value in values.items():
+                result = legacy_h5_format.read_dataset(f[name])
+                self.assertEqual(result.dtype, value.dtype)
+                self.assertAllClose(result, value)
+
+    def test_get_chunk_shape(self):
+        self.assertIsNone(legacy_h5_format.get_chunk_shape((), "float32"))
+        self.assertIsNone(legacy_h5_format.get_chunk_shape((0, 3), "float32"))
+        self.assertEqual(
+            legacy_h5_format.get_chunk_shape((64, 32), "float32"), (64, 32)
+        )
+        # 64MB weight: chunks of 1MB along the leading axis.
+        self.assertEqual(
+            legacy_h5_format.get_chunk_shape((4096, 4096), "float32"),
+            (64, 4096),
+        )
+        # Rows larger than the target chunk size: one row per chunk.
+        self.assertEqual(
+            legacy_h5_format.get_chunk_shape((4, 2**20, 8), "float32"),
+            (1, 2**20, 8),
+        )
+
+    def test_read_subsets_ahead(self):
+        import h5py
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "subsets.h5")
+        num_groups = 2 * legacy_h5_format.HDF5_READ_WORKERS + 3
+        with h5py.File(temp_filepath, "w") as f:
+            for i in range(num_groups):
+                g = f.create_group(f"layer_{i}")
+                legacy_h5_format.save_attributes_to_hdf5_group(
+                    g, "weight_names", [b"kernel"]
+                )
+                g.create_dataset("kernel", data=np.full((2, 3), i))
+        with h5py.File(temp_filepath, "r") as f:
+            results = list(
+                legacy_h5_format._read_subsets_ahead(
+                    f[f"layer_{i}"] for i in range(num_groups)
+                )
+            )
+        self.assertLen(results, num_groups)
+        for i, weight_values in enumerate(results):
+            self.assertLen(weight_values, 1)
+            self.assertAllClose(weight_values[0], np.full((2, 3), i))
+
+    def test_load_weights_by_name(self):
+        import h5py
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "weights.h5")
+        model = keras_core.Sequential(
+            [
+                keras_core.Input((3,)),
+                layers.Dense(4, name="first"),
+                layers.Dense(2, name="second"),
+            ]
+        )
+        with h5py.File(temp_filepath, "w") as f:
+            legacy_h5_format.save_weights_to_hdf5_group(f, model)
+
+        # Layers are matched by name, whatever their order, and layers
+        # without a saved counterpart are left untouched.
+        new_model = keras_core.Sequential(
+            [
+                keras_core.Input((3,)),
+                layers.Dense(4, name="first"),
+                layers.Dense(4, name="other"),
+                layers.Dense(2, name="second"),
+            ]
+        )
+        other_weights = new_model.layers[1].get_weights()
+        with h5py.File(temp_filepath, "r") as f:
+            # The (empty) top-level weights of the saved model do not match
+            # those of `new_model`, which gathers the weights of its layers.
+            legacy_h5_format.load_weights_from_hdf5_group_by_name(
+                f, new_model, skip_mismatch=True
+            )
+        for name in ("first", "second"):
+            for w_ref, w in zip(
+                model.get_layer(name).get_weights(),
+                new_model.get_layer(name).get_weights(),
+            ):
+                self.assertAllClose(w_ref, w)
+        for w_ref, w in zip(other_weights, new_model.layers[1].get_weights()):
+            self.assertAllClose(w_ref, w)
+
+    def test_load_attributes_from_attrs_snapshot(self):
+        import h5py
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "attrs.h5")
+        # Long enough to be split into several chunked attributes.
+        layer_names = [f"layer_{i:05d}".encode("utf8") for i in range(8000)]
+        with h5py.File(temp_filepath, "w") as f:
+            legacy_h5_format.save_attributes_to_hdf5_group(
+                f, "layer_names", layer_names
+            )
+        with h5py.File(temp_filepath, "r") as f:
+            attrs = dict(f.attrs)
+            self.assertNotIn("layer_names", attrs)
+            result = legacy_h5_format.load_attributes_from_hdf5_group(
+                f, "layer_names", attrs=attrs
+            )
+        self.assertEqual(result, [n.decode("utf8") for n in layer_names])
@@ -11,6 +11,7 @@ from keras_core.models.variable_mapping import map_trackable_variables
 from keras_core.saving import saving_api
 from keras_core.saving import saving_lib
 from keras_core.trainers import trainer as base_trainer
+from keras_core.utils import file_utils
 from keras_core.utils import io_utils
 from keras_core.utils import summary_utils
 from keras_core.utils import traceback_utils
@@ -312,20 +313,13 @@ class Model(Trainer, Layer):
                 "Unknown `save_format` value. Only the `'keras'` format is "
                 f"currently supported. Received: save_format={save_format}"
             )
-        if not str(filepath).endswith(".keras"):
+        filepath = file_utils.path_to_string(filepath)
+        if not filepath.endswith(".keras"):
             raise ValueError(
                 "The filename must end in `.keras`. "
                 f"Received: filepath={filepath}"
             )
-        try:
-            exists = os.path.exists(filepath)
-        except TypeError:
-            exists = False
-        if exists and not overwrite:
-            proceed = io_utils.ask_to_proceed_with_overwrite(filepath)
-            if not proceed:
-                return
-        saving_lib.save_model(self, filepath)
+        saving_api.save_model(self, filepath, overwrite=overwrite)
 
     @traceback_utils.filter_traceback
     def save_weights(self, filepath, overwrite=True):
@@ -338,7 +332,8 @@ class Model(Trainer, Layer):
                 at the target location, or instead ask the user
                 via an interactive prompt.
         """
-        if not str(filepath).endswith(".weights.h5"):
+        filepath = file_utils.path_to_string(filepath)
+        if not filepath.endswith(".weights.h5"):
             raise ValueError(
                 "The filename must end in `.weights.h5`. "
                 f"Received: filepath={filepath}"
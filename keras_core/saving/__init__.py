@@ -5,5 +5,8 @@ from keras_core.saving.object_registration import get_registered_name
 from keras_core.saving.object_registration import get_registered_object
 from keras_core.saving.object_registration import register_keras_serializable
 from keras_core.saving.saving_api import load_model
+from keras_core.saving.saving_api import load_model_async
+from keras_core.saving.saving_api import load_weights_async
+from keras_core.saving.saving_api import save_model_async
 from keras_core.saving.serialization_lib import deserialize_keras_object
 from keras_core.saving.serialization_lib import serialize_keras_object
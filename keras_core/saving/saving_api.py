@@ -1,4 +1,11 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import inspect
+import mmap
 import os
+import shutil
+import sys
 import zipfile
 
 from absl import logging
@@ -8,11 +15,25 @@ from keras_core.legacy.saving import legacy_h5_format
 from keras_core.saving import saving_lib
 from keras_core.utils import file_utils
 from keras_core.utils import io_utils
+from keras_core.utils.module_utils import h5py
 
-try:
-    import h5py
-except ImportError:
-    h5py = None
+# `.keras` files at least this large are read with direct I/O on Linux.
+_DIRECT_IO_MIN_SIZE = 64 * 1024 * 1024
+_DIRECT_IO_CHUNK_SIZE = 16 * 1024 * 1024
+_DIRECT_IO_ALIGNMENT = 4096
+
+# Signature of the first local file header of a zip archive.
+_ZIP_SIGNATURE = b"PK\x03\x04"
+# Signature at the start of HDF5 files.
+_HDF5_SIGNATURE = b"\x89HDF\r\n\x1a\n"
+
+# Weights format and zip compression method of `.keras` archives for each
+# value of the `compression` argument of `save_model()`.
+_COMPRESSION_OPTIONS = {
+    "stored": ("h5", zipfile.ZIP_STORED),
+    "deflated": ("h5", zipfile.ZIP_DEFLATED),
+    "blosc2": ("blosc2", zipfile.ZIP_STORED),
+}
 
 
 @keras_core_export(
@@ -26,6 +47,29 @@ def save_model(model, filepath, overwrite=True, **kwargs):
         filepath: `str` or `pathlib.Path` object. Path where to save the model.
         overwrite: Whether we should overwrite any existing model at the target
             location, or instead ask the user via an interactive prompt.
+        compression: Compression used for the entries of a `.keras` archive.
+            One of `"stored"` (no compression), `"deflated"` or
+            `"blosc2"`. Weight tensors typically compress by only 5-10%
+            with DEFLATE, which is slow enough to dominate the saving time
+            of large models, so defaults to `"stored"`. `"blosc2"` stores
+            each weight compressed with byte shuffling and zstd, which
+            compresses floating point weights better at memory speed, and
+            requires the `blosc2` package. The JSON configuration and
+            metadata entries are always deflated.
+        incremental: Optional path of a previously saved `.keras` file. If
+            specified, only the variable elements that changed since that
+            checkpoint are saved, along with a reference to it. The base
+            checkpoint must be kept, since it is needed to load the model.
+            A full checkpoint is saved instead once 10 incremental
+            checkpoints have been chained.
+        delta_base: Optional path of a previously saved `.weights.h5.delta`
+            file, only for `.weights.h5.delta` files. These files only
+            hold the weights of the model, stored as the changes of their
+            8-bit codes since the `delta_base` checkpoint.
+        quantize: For `.weights.h5.delta` files, either `"int8"` (default)
+            to store floating point weights with per-tensor 8-bit
+            quantization, which is lossy, or `None` to store them
+            losslessly.
 
     Example:
 
@@ -54,10 +98,10 @@ def save_model(model, filepath, overwrite=True, **kwargs):
     """
     include_optimizer = kwargs.pop("include_optimizer", True)
     save_format = kwargs.pop("save_format", False)
+    filepath = file_utils.path_to_string(filepath)
+    extension = os.path.splitext(filepath)[1]
     if save_format:
-        if str(filepath).endswith((".h5", ".hdf5")) or str(filepath).endswith(
-            ".keras"
-        ):
+        if extension in (".h5", ".hdf5", ".keras"):
             logging.warning(
                 "The `save_format` argument is deprecated in Keras Core. "
                 "We recommend removing this argument as it can be inferred "
@@ -71,45 +115,30 @@ def save_model(model, filepath, overwrite=True, **kwargs):
                 "either `.keras` or `.h5` extension."
                 f"Received: save_format={save_format}"
             )
-    if kwargs:
-        raise ValueError(
-            "The following argument(s) are not supported: "
-            f"{list(kwargs.keys())}"
-        )
-
-    # Deprecation warnings
-    if str(filepath).endswith((".h5", ".hdf5")):
-        logging.warning(
-            "You are saving your model as an HDF5 file via `model.save()`. "
-            "This file format is considered legacy. "
-            "We recommend using instead the native Keras format, "
-            "e.g. `model.save('my_model.keras')`."
-        )
-
-    if str(filepath).endswith(".keras"):
-        # If file exists and should not be overwritten.
-        try:
-            exists = os.path.exists(filepath)
-        except TypeError:
-            exists = False
-        if exists and not overwrite:
-            proceed = io_utils.ask_to_proceed_with_overwrite(filepath)
-            if not proceed:
-                return
-        saving_lib.save_model(model, filepath)
-    elif str(filepath).endswith((".h5", ".hdf5")):
-        legacy_h5_format.save_model_to_hdf5(
-            model, filepath, overwrite, include_optimizer
-        )
-    else:
+    format_extension, handler = _get_handler(
+        _SAVE_DISPATCH, filepath, extension
+    )
+    if handler is None:
         raise ValueError(
             "Invalid filepath extension for saving. "
             "Please add either a `.keras` extension for the native Keras "
-            f"format (recommended) or a `.h5` extension. "
+            "format (recommended), a `.zarr` extension for the Zarr format "
+            "or a `.h5` extension. "
             "Use `tf.saved_model.save()` if you want to export a SavedModel "
             "for use with TFLite/TFServing/etc. "
             f"Received: filepath={filepath}."
         )
+    parameters = _HANDLER_PARAMETERS[handler]
+    # Only used by the legacy H5 format, but accepted for all formats.
+    if "include_optimizer" in parameters:
+        kwargs["include_optimizer"] = include_optimizer
+    unsupported = [name for name in kwargs if name not in parameters]
+    if unsupported:
+        raise ValueError(
+            "The following argument(s) are not supported for "
+            f"`{format_extension}` files: {unsupported}"
+        )
+    handler(model, filepath, overwrite, **kwargs)
 
 
 @keras_core_export(
@@ -151,86 +180,449 @@ def load_model(filepath, custom_objects=None, compile=True, safe_mode=True):
     It is recommended that you use layer attributes to
     access specific variables, e.g. `model.get_layer("dense_1").kernel`.
     """
-    is_keras_zip = str(filepath).endswith(".keras") and zipfile.is_zipfile(
-        filepath
-    )
+    filepath = file_utils.path_to_string(filepath)
+    # Support for remote zip and H5 files
+    if file_utils.is_remote_path(filepath) and not file_utils.isdir(filepath):
+        # Only read the signature of the remote file to decide on its format,
+        # so that it is only downloaded once it is known to be loadable.
+        header = _read_header(filepath, len(_HDF5_SIGNATURE))
+        if header.startswith(_ZIP_SIGNATURE):
+            handler = _load_keras
+        elif header == _HDF5_SIGNATURE:
+            handler = _load_h5
+        else:
+            raise ValueError(
+                f"File format not supported: filepath={filepath}. "
+                "The remote file is neither a `.keras` zip file nor a "
+                "legacy H5 format file."
+            )
+        return _download_and_load(
+            filepath, handler, custom_objects, compile, safe_mode
+        )
 
-    # Support for remote zip files
-    if (
-        file_utils.is_remote_path(filepath)
-        and not file_utils.isdir(filepath)
-        and not is_keras_zip
-    ):
-        local_path = os.path.join(
-            saving_lib.get_temp_dir(), os.path.basename(filepath)
+    extension = os.path.splitext(filepath)[1]
+    _, handler = _get_handler(_LOAD_DISPATCH, filepath, extension)
+    if handler is None:
+        raise ValueError(
+            f"File format not supported: filepath={filepath}. "
+            "Keras Core only supports V3 `.keras` files, `.zarr` "
+            "files and legacy H5 format files (`.h5` extension). "
+            "Note that the legacy SavedModel format is not "
+            "supported in Keras Core."
         )
+    return handler(filepath, custom_objects, compile, safe_mode)
 
-        # Copy from remote to temporary local directory
-        file_utils.copy(filepath, local_path, overwrite=True)
 
-        # Switch filepath to local zipfile for loading model
-        if zipfile.is_zipfile(local_path):
-            filepath = local_path
-            is_keras_zip = True
+def load_weights(model, filepath, skip_mismatch=False, **kwargs):
+    filepath = file_utils.path_to_string(filepath)
+    extension = os.path.splitext(filepath)[1]
+    _, handler = _get_handler(_WEIGHTS_DISPATCH, filepath, extension)
+    if handler is None:
+        raise ValueError(
+            f"File format not supported: filepath={filepath}. "
+            "Keras Core only supports V3 `.keras` and `.weights.h5` "
+            "files."
+        )
+    handler(model, filepath, skip_mismatch, **kwargs)
 
-    if is_keras_zip:
-        return saving_lib.load_model(
-            filepath,
-            custom_objects=custom_objects,
-            compile=compile,
-            safe_mode=safe_mode,
+
+def _get_handler(dispatch, filepath, extension):
+    """Returns the extension of `dispatch` matching `filepath`, whose last
+    extension is `extension`, and its handler (or `(None, None)` if there
+    is none)."""
+    for compound_extension in _COMPOUND_EXTENSIONS.get(extension, ()):
+        if compound_extension in dispatch and filepath.endswith(
+            compound_extension
+        ):
+            return compound_extension, dispatch[compound_extension]
+    handler = dispatch.get(extension)
+    if handler is None:
+        return None, None
+    return extension, handler
+
+
+def _download_and_load(filepath, handler, custom_objects, compile, safe_mode):
+    """Downloads a remote file to a temporary local directory, and loads
+    the model from the local copy with `handler`."""
+    temp_dir = saving_lib.get_temp_dir()
+    local_path = os.path.join(temp_dir, os.path.basename(filepath))
+    try:
+        _parallel_download(filepath, local_path)
+        return handler(local_path, custom_objects, compile, safe_mode)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _confirm_overwrite(filepath, overwrite):
+    """Returns whether saving to `filepath` should proceed."""
+    if overwrite:
+        return True
+    # If file exists and should not be overwritten.
+    try:
+        exists = os.path.exists(filepath)
+    except TypeError:
+        exists = False
+    if exists:
+        return io_utils.ask_to_proceed_with_overwrite(filepath)
+    return True
+
+
+def _save_keras(
+    model, filepath, overwrite, compression="stored", incremental=None
+):
+    if compression not in _COMPRESSION_OPTIONS:
+        raise ValueError(
+            "Invalid `compression` argument. Expected one of "
+            f"{list(_COMPRESSION_OPTIONS.keys())}. "
+            f"Received: compression={compression}"
         )
-    if str(filepath).endswith((".h5", ".hdf5")):
-        return legacy_h5_format.load_model_from_hdf5(filepath)
-    elif str(filepath).endswith(".keras"):
+    weights_format, zip_compression = _COMPRESSION_OPTIONS[compression]
+    if incremental is not None and weights_format != "h5":
         raise ValueError(
-            f"File not found: filepath={filepath}. "
-            "Please ensure the file is an accessible `.keras` "
-            "zip file."
+            "Incremental checkpoints do not support "
+            f"`compression='{compression}'`. Expected 'stored' or 'deflated'."
         )
+    if overwrite or file_utils.is_remote_path(filepath):
+        if not _confirm_overwrite(filepath, overwrite):
+            return
+        new_file = contextlib.nullcontext(filepath)
     else:
-        raise ValueError(
-            f"File format not supported: filepath={filepath}. "
-            "Keras Core only supports V3 `.keras` files and "
-            "legacy H5 format files (`.h5` extension). "
-            "Note that the legacy SavedModel format is not "
-            "supported in Keras Core."
+        # Create the file if it does not exist, in a single system call,
+        # rather than checking for its existence first.
+        new_file = _create_new_file(filepath)
+        if new_file is None:
+            if not io_utils.ask_to_proceed_with_overwrite(filepath):
+                return
+            new_file = contextlib.nullcontext(filepath)
+    try:
+        with new_file as target:
+            saving_lib.save_model(
+                model,
+                target,
+                weights_format=weights_format,
+                zip_compression=zip_compression,
+                base_filepath=incremental,
+            )
+    except BaseException:
+        # Do not leave behind a partial archive in the file we created.
+        if not isinstance(new_file, contextlib.nullcontext):
+            os.unlink(filepath)
+        raise
+
+
+def _save_zarr(model, filepath, overwrite):
+    if _confirm_overwrite(filepath, overwrite):
+        saving_lib.save_model_zarr(model, filepath)
+
+
+def _save_weights_delta(
+    model, filepath, overwrite, delta_base=None, quantize="int8"
+):
+    if _confirm_overwrite(filepath, overwrite):
+        saving_lib.save_weights_delta(
+            model, filepath, delta_base=delta_base, quantize=quantize
         )
 
 
-def load_weights(model, filepath, skip_mismatch=False, **kwargs):
-    if str(filepath).endswith(".keras"):
-        if kwargs:
-            raise ValueError(f"Invalid keyword arguments: {kwargs}")
-        saving_lib.load_weights_only(
-            model, filepath, skip_mismatch=skip_mismatch
+def _save_h5(model, filepath, overwrite, include_optimizer=True):
+    # Deprecation warning
+    logging.warning(
+        "You are saving your model as an HDF5 file via `model.save()`. "
+        "This file format is considered legacy. "
+        "We recommend using instead the native Keras format, "
+        "e.g. `model.save('my_model.keras')`."
+    )
+    legacy_h5_format.save_model_to_hdf5(
+        model, filepath, overwrite, include_optimizer
+    )
+
+
+def _load_keras(filepath, custom_objects, compile, safe_mode):
+    zip_file = _open_zip_file(filepath)
+    if zip_file is None:
+        raise ValueError(
+            f"File not found: filepath={filepath}. "
+            "Please ensure the file is an accessible `.keras` "
+            "zip file."
         )
-    elif str(filepath).endswith(".weights.h5"):
-        if kwargs:
-            raise ValueError(f"Invalid keyword arguments: {kwargs}")
-        saving_lib.load_weights_only(
-            model, filepath, skip_mismatch=skip_mismatch
+    with zip_file:
+        return saving_lib.load_model(
+            zip_file,
+            custom_objects=custom_objects,
+            compile=compile,
+            safe_mode=safe_mode,
         )
-    elif str(filepath).endswith(".h5") or str(filepath).endswith(".hdf5"):
-        by_name = kwargs.pop("by_name", False)
-        if kwargs:
-            raise ValueError(f"Invalid keyword arguments: {kwargs}")
-        if not h5py:
-            raise ImportError(
-                "Loading a H5 file requires `h5py` to be installed."
+
+
+def _load_zarr(filepath, custom_objects, compile, safe_mode):
+    return saving_lib.load_model_zarr(
+        filepath,
+        custom_objects=custom_objects,
+        compile=compile,
+        safe_mode=safe_mode,
+    )
+
+
+def _load_h5(filepath, custom_objects, compile, safe_mode):
+    return legacy_h5_format.load_model_from_hdf5(filepath)
+
+
+def _load_weights_v3(model, filepath, skip_mismatch, **kwargs):
+    if kwargs:
+        raise ValueError(f"Invalid keyword arguments: {kwargs}")
+    saving_lib.load_weights_only(model, filepath, skip_mismatch=skip_mismatch)
+
+
+def _load_weights_h5(model, filepath, skip_mismatch, by_name=False, **kwargs):
+    if kwargs:
+        raise ValueError(f"Invalid keyword arguments: {kwargs}")
+    if not h5py.available:
+        raise ImportError("Loading a H5 file requires `h5py` to be installed.")
+    with h5py.File(
+        filepath,
+        "r",
+        rdcc_nbytes=legacy_h5_format.HDF5_CHUNK_CACHE_BYTES,
+        rdcc_nslots=legacy_h5_format.HDF5_CHUNK_CACHE_SLOTS,
+    ) as f:
+        # Read the attributes once, rather than on every lookup.
+        attrs = dict(f.attrs)
+        if "layer_names" not in attrs and "model_weights" in f:
+            f = f["model_weights"]
+            attrs = dict(f.attrs)
+        if by_name:
+            legacy_h5_format.load_weights_from_hdf5_group_by_name(
+                f, model, skip_mismatch, attrs=attrs
             )
-        with h5py.File(filepath, "r") as f:
-            if "layer_names" not in f.attrs and "model_weights" in f:
-                f = f["model_weights"]
-            if by_name:
-                legacy_h5_format.load_weights_from_hdf5_group_by_name(
-                    f, model, skip_mismatch
-                )
-            else:
-                legacy_h5_format.load_weights_from_hdf5_group(f, model)
-    else:
-        raise ValueError(
-            f"File format not supported: filepath={filepath}. "
-            "Keras Core only supports V3 `.keras` and `.weights.h5` "
-            "files."
+        else:
+            legacy_h5_format.load_weights_from_hdf5_group(f, model, attrs=attrs)
+
+
+# Names of the parameters of each registered handler.
+_HANDLER_PARAMETERS = {}
+
+
+def _register_handlers(dispatch, handlers):
+    """Registers the `{extension: handler}` entries of `handlers` in
+    `dispatch`.
+
+    The parameters of the handlers are recorded, so that they do not have
+    to be inspected when saving.
+    """
+    dispatch.update(handlers)
+    for handler in handlers.values():
+        _HANDLER_PARAMETERS[handler] = frozenset(
+            inspect.signature(handler).parameters
         )
+
+
+# Compound extensions, keyed by their last component. When a dispatch table
+# has a handler for one of them, it takes precedence over the handler of the
+# last component (e.g. `.weights.h5` over `.h5`).
+_COMPOUND_EXTENSIONS = {
+    ".h5": (".weights.h5",),
+    ".delta": (".weights.h5.delta",),
+}
+
+# Handlers of each file extension.
+# Saving handlers are called as `handler(model, filepath, overwrite, **opts)`,
+# where `opts` are the keyword arguments of `save_model()` they accept.
+_SAVE_DISPATCH = {}
+_register_handlers(
+    _SAVE_DISPATCH,
+    {
+        ".keras": _save_keras,
+        ".zarr": _save_zarr,
+        ".weights.h5.delta": _save_weights_delta,
+        ".h5": _save_h5,
+        ".hdf5": _save_h5,
+    },
+)
+# Called as `handler(filepath, custom_objects, compile, safe_mode)`.
+_LOAD_DISPATCH = {}
+_register_handlers(
+    _LOAD_DISPATCH,
+    {
+        ".keras": _load_keras,
+        ".zarr": _load_zarr,
+        ".h5": _load_h5,
+        ".hdf5": _load_h5,
+    },
+)
+# Called as `handler(model, filepath, skip_mismatch, **kwargs)`.
+_WEIGHTS_DISPATCH = {}
+_register_handlers(
+    _WEIGHTS_DISPATCH,
+    {
+        ".keras": _load_weights_v3,
+        ".weights.h5": _load_weights_v3,
+        ".weights.h5.delta": _load_weights_v3,
+        ".h5": _load_weights_h5,
+        ".hdf5": _load_weights_h5,
+    },
+)
+
+
+def _create_new_file(filepath):
+    """Opens a new file for writing, or returns `None` if it exists."""
+    try:
+        return open(filepath, "xb")
+    except FileExistsError:
+        return None
+
+
+def _read_header(filepath, num_bytes=4):
+    """Reads the first bytes of a (possibly remote) file."""
+    with file_utils.File(filepath, "rb") as f:
+        return f.read(num_bytes)
+
+
+def _open_zip_file(filepath):
+    """Opens a local zip archive for reading.
+
+    Only the signature at the start of the file is checked, so that the same
+    file object is used to check and to load the archive. Large archives are
+    read with direct I/O on Linux.
+
+    Returns:
+        A readable and seekable file object, or `None` if the file does not
+        exist or is not a zip archive.
+    """
+    try:
+        f = open(filepath, "rb")
+    except OSError:
+        return None
+    if f.read(len(_ZIP_SIGNATURE)) != _ZIP_SIGNATURE:
+        f.close()
+        return None
+    if (
+        sys.platform.startswith("linux")
+        and os.fstat(f.fileno()).st_size >= _DIRECT_IO_MIN_SIZE
+    ):
+        # Large archive: read it in one pass, bypassing the page cache.
+        f.close()
+        return _read_file_direct(filepath)
+    f.seek(0)
+    return f
+
+
+def _parallel_download(
+    filepath, local_path, num_workers=8, chunk_size=16 * 1024 * 1024
+):
+    """Copies a (remote) file to a local path using concurrent range reads.
+
+    The file is split into chunks of `chunk_size` bytes, which are read by
+    `num_workers` threads and written at their offset in `local_path`. The
+    reads of remote filesystems (e.g. GCS) release the GIL, so throughput
+    scales with the number of workers.
+    """
+    with file_utils.File(filepath, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+    with open(local_path, "wb") as f:
+        f.truncate(size)
+
+    def download_chunk(offset):
+        with file_utils.File(filepath, "rb") as src, open(
+            local_path, "r+b"
+        ) as dst:
+            src.seek(offset)
+            dst.seek(offset)
+            dst.write(src.read(min(chunk_size, size - offset)))
+
+    with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+        # Consume the results to re-raise any error from the workers.
+        list(executor.map(download_chunk, range(0, size, chunk_size)))
+
+
+def _read_file_direct(filepath):
+    """Reads a whole local file into memory, bypassing the page cache.
+
+    The file is read in large chunks with `O_DIRECT` into a page-aligned
+    anonymous memory map, which is much faster than buffered reads for cold
+    files on NVMe drives. The unaligned tail of the file, and the whole file
+    on filesystems that do not support `O_DIRECT` (e.g. tmpfs or NFS), are
+    read with regular buffered I/O.
+
+    Returns:
+        A read-only, seekable file object over the content of the file.
+    """
+    size = os.path.getsize(filepath)
+    buffer = mmap.mmap(-1, max(size, 1))
+    with memoryview(buffer) as view:
+        aligned_size = size - size % _DIRECT_IO_ALIGNMENT
+        offset = _read_direct_into(filepath, view[:aligned_size])
+        with open(filepath, "rb") as f:
+            f.seek(offset)
+            f.readinto(view[offset:size])
+    return saving_lib.MemoryFile(buffer, size=size, name=filepath)
+
+
+def _read_direct_into(filepath, view):
+    """Reads the start of a file into `view` with `O_DIRECT`.
+
+    Returns the number of bytes read, which is 0 if `O_DIRECT` is not
+    supported.
+    """
+    if not hasattr(os, "O_DIRECT") or not hasattr(os, "preadv"):
+        return 0
+    try:
+        fd = os.open(filepath, os.O_RDONLY | os.O_DIRECT)
+    except OSError:
+        return 0
+    offset = 0
+    try:
+        while offset < len(view):
+            chunk = view[offset : offset + _DIRECT_IO_CHUNK_SIZE]
+            num_bytes = os.preadv(fd, [chunk], offset)
+            chunk.release()
+            if num_bytes <= 0:
+                break
+            offset += num_bytes
+    except OSError:
+        # E.g. `EINVAL` if the filesystem rejects direct reads. The rest of
+        # the file is read with buffered I/O.
+        pass
+    finally:
+        os.close(fd)
+    return offset
+
+
+@keras_core_export("keras_core.saving.save_model_async")
+async def save_model_async(model, filepath, overwrite=True, **kwargs):
+    """Asynchronous variant of `save_model()`.
+
+    The blocking file I/O (notably for large legacy H5 files) runs in a
+    worker thread via `asyncio.to_thread()`, so that the event loop stays
+    responsive. Arguments are the same as for `save_model()`.
+    """
+    return await asyncio.to_thread(
+        save_model, model, filepath, overwrite, **kwargs
+    )
+
+
+@keras_core_export("keras_core.saving.load_model_async")
+async def load_model_async(
+    filepath, custom_objects=None, compile=True, safe_mode=True
+):
+    """Asynchronous variant of `load_model()`.
+
+    Arguments are the same as for `load_model()`.
+    """
+    return await asyncio.to_thread(
+        load_model,
+        filepath,
+        custom_objects=custom_objects,
+        compile=compile,
+        safe_mode=safe_mode,
+    )
+
+
+@keras_core_export("keras_core.saving.load_weights_async")
+async def load_weights_async(model, filepath, skip_mismatch=False, **kwargs):
+    """Asynchronous variant of `load_weights()`.
+
+    Arguments are the same as for `load_weights()`.
+    """
+    return await asyncio.to_thread(
+        load_weights, model, filepath, skip_mismatch=skip_mismatch, **kwargs
+    )
@@ -1,11 +1,19 @@
 """Python-based idempotent model-saving functionality."""
 
+import concurrent.futures
 import datetime
+import hashlib
 import io
 import json
+import mmap
+import os
+import posixpath
+import shutil
+import struct
 import tempfile
 import warnings
 import zipfile
+import zlib
 
 import numpy as np
 
@@ -20,20 +28,36 @@ from keras_core.saving.serialization_lib import serialize_keras_object
 from keras_core.trainers.compile_utils import CompileMetrics
 from keras_core.utils import file_utils
 from keras_core.utils import naming
+from keras_core.utils.module_utils import blosc2
+from keras_core.utils.module_utils import h5py
+from keras_core.utils.module_utils import numcodecs
+from keras_core.utils.module_utils import zarr
 from keras_core.version import __version__ as keras_version
 
-try:
-    import h5py
-except ImportError:
-    h5py = None
-
 _CONFIG_FILENAME = "config.json"
 _METADATA_FILENAME = "metadata.json"
 _VARS_FNAME = "model.weights"  # Will become e.g. "model.weights.h5"
 _ASSETS_DIRNAME = "assets"
-
-
-def save_model(model, filepath, weights_format="h5"):
+_COPY_BUFFER_SIZE = 16 * 1024 * 1024
+# Maximum number of incremental checkpoints between two full checkpoints.
+_MAX_DELTA_CHAIN_LENGTH = 10
+# Magic string at the start of `.npy` files.
+_NPY_MAGIC = b"\x93NUMPY"
+# Maximum number of threads decoding archive members concurrently.
+_MAX_DECODE_WORKERS = 8
+# Size and signature of the local file header of a zip archive member, which
+# is followed by the member name, an extra field, and then the member data.
+_ZIP_LOCAL_HEADER_SIZE = 30
+_ZIP_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+
+def save_model(
+    model,
+    filepath,
+    weights_format="h5",
+    zip_compression=zipfile.ZIP_STORED,
+    base_filepath=None,
+):
     """Save a zip-archive representing a Keras model to the given filepath.
 
     The zip-based archive contains the following structure:
@@ -56,15 +80,58 @@ def save_model(model, filepath, weights_format="h5"):
     they are either 1) referenced via layer attributes, or 2) referenced via a
     container (list, tuple, or dict), and the container is referenced via a
     layer attribute.
+
+    `zip_compression` is the compression method (e.g. `zipfile.ZIP_STORED`)
+    used for the weights and assets entries of the archive. The JSON entries
+    are always deflated, since they are small and compress well.
+
+    If `base_filepath` is specified, the archive is an incremental checkpoint:
+    only the variables (or the elements of the variables) that differ from
+    the `.keras` archive at `base_filepath` are stored (see `DeltaIOStore`).
+    Incremental checkpoints require `weights_format="h5"`.
+
+    `filepath` may also be a binary file object opened for writing, which
+    is left open.
     """
-    filepath = str(filepath)
-    if not filepath.endswith(".keras"):
-        raise ValueError(
-            "Invalid `filepath` argument: expected a `.keras` extension. "
-            f"Received: filepath={filepath}"
-        )
-    if weights_format == "h5" and h5py is None:
+    fileobj = None
+    if isinstance(filepath, io.IOBase):
+        fileobj, filepath = filepath, None
+    else:
+        filepath = str(filepath)
+        if not filepath.endswith(".keras"):
+            raise ValueError(
+                "Invalid `filepath` argument: expected a `.keras` extension. "
+                f"Received: filepath={filepath}"
+            )
+    # Location of the archive, against which the path of its base
+    # checkpoint is recorded.
+    location = filepath
+    if fileobj is not None and isinstance(getattr(fileobj, "name", None), str):
+        location = fileobj.name
+    if base_filepath is not None:
+        if weights_format != "h5":
+            raise ValueError(
+                "Incremental checkpoints only support "
+                "`weights_format='h5'`. "
+                f"Received: weights_format={weights_format}"
+            )
+        base_filepath = str(base_filepath)
+        if not file_utils.is_remote_path(base_filepath):
+            base_filepath = os.path.abspath(base_filepath)
+        base_filepaths = [base_filepath] + _get_base_filepaths(base_filepath)
+        if filepath is not None and os.path.abspath(filepath) in base_filepaths:
+            raise ValueError(
+                "An incremental checkpoint cannot overwrite one of its base "
+                f"checkpoints. Received: filepath={filepath}, "
+                f"base checkpoints: {base_filepaths}"
+            )
+    if weights_format == "h5" and not h5py.available:
         raise ImportError("h5py must be installed in order to save a model.")
+    if weights_format == "blosc2" and not blosc2.available:
+        raise ImportError(
+            "blosc2 must be installed in order to save a model with "
+            "`weights_format='blosc2'`."
+        )
 
     if not model.built:
         warnings.warn(
@@ -75,59 +142,93 @@ def save_model(model, filepath, weights_format="h5"):
             stacklevel=2,
         )
 
-    with ObjectSharingScope():
-        serialized_model_dict = serialize_keras_object(model)
-    config_json = json.dumps(serialized_model_dict)
-    metadata_json = json.dumps(
-        {
-            "keras_version": keras_version,
-            "date_saved": datetime.datetime.now().strftime("%Y-%m-%d@%H:%M:%S"),
-        }
-    )
-    if file_utils.is_remote_path(filepath):
-        # Remote path. Zip to local memory byte io and copy to remote
-        zip_filepath = io.BytesIO()
+    config_json, metadata_json = _serialize_model(model)
+    is_remote = filepath is not None and file_utils.is_remote_path(filepath)
+    temp_dir = None
+    if is_remote:
+        # Remote path. Zip to a local temporary file and stream it to remote,
+        # rather than holding the whole archive in memory.
+        temp_dir = get_temp_dir()
+        zip_filepath = os.path.join(temp_dir, os.path.basename(filepath))
+    elif fileobj is not None:
+        zip_filepath = fileobj
     else:
         zip_filepath = filepath
 
-    with zipfile.ZipFile(zip_filepath, "w") as zf:
-        with zf.open(_METADATA_FILENAME, "w") as f:
-            f.write(metadata_json.encode())
-        with zf.open(_CONFIG_FILENAME, "w") as f:
-            f.write(config_json.encode())
-
-        if weights_format == "h5":
-            weights_store = H5IOStore(_VARS_FNAME + ".h5", archive=zf, mode="w")
-        elif weights_format == "npz":
-            weights_store = NpzIOStore(
-                _VARS_FNAME + ".npz", archive=zf, mode="w"
+    try:
+        with zipfile.ZipFile(
+            zip_filepath, "w", compression=zip_compression
+        ) as zf:
+            zf.writestr(
+                _METADATA_FILENAME,
+                metadata_json.encode(),
+                compress_type=zipfile.ZIP_DEFLATED,
             )
-        else:
-            raise ValueError(
-                "Unknown `weights_format` argument. "
-                "Expected 'h5' or 'npz'. "
-                f"Received: weights_format={weights_format}"
+            zf.writestr(
+                _CONFIG_FILENAME,
+                config_json.encode(),
+                compress_type=zipfile.ZIP_DEFLATED,
             )
 
-        asset_store = DiskIOStore(_ASSETS_DIRNAME, archive=zf, mode="w")
+            if base_filepath is not None:
+                weights_store = DeltaIOStore(
+                    _VARS_FNAME + ".delta",
+                    archive=zf,
+                    mode="w",
+                    base_filepaths=base_filepaths,
+                    filepath=location,
+                )
+            elif weights_format == "h5":
+                weights_store = H5IOStore(
+                    _VARS_FNAME + ".h5", archive=zf, mode="w"
+                )
+            elif weights_format == "npz":
+                weights_store = NpzIOStore(
+                    _VARS_FNAME + ".npz", archive=zf, mode="w"
+                )
+            elif weights_format == "blosc2":
+                weights_store = Blosc2IOStore(
+                    _VARS_FNAME + ".blosc2", archive=zf, mode="w"
+                )
+            else:
+                raise ValueError(
+                    "Unknown `weights_format` argument. "
+                    "Expected 'h5', 'npz' or 'blosc2'. "
+                    f"Received: weights_format={weights_format}"
+                )
+
+            asset_store = DiskIOStore(_ASSETS_DIRNAME, archive=zf, mode="w")
 
-        _save_state(
-            model,
-            weights_store=weights_store,
-            assets_store=asset_store,
-            inner_path="",
-            visited_trackables=set(),
-        )
-        weights_store.close()
-        asset_store.close()
+            _save_state(
+                model,
+                weights_store=weights_store,
+                assets_store=asset_store,
+                inner_path="",
+                visited_trackables=set(),
+            )
+            weights_store.close()
+            asset_store.close()
 
-    if file_utils.is_remote_path(filepath):
-        with file_utils.File(filepath, "wb") as f:
-            f.write(zip_filepath.getvalue())
+        if is_remote:
+            with open(zip_filepath, "rb") as src, file_utils.File(
+                filepath, "wb"
+            ) as dst:
+                shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir)
 
 
 def load_model(filepath, custom_objects=None, compile=True, safe_mode=True):
-    """Load a zip archive representing a Keras model."""
+    """Load a zip archive representing a Keras model.
+
+    `filepath` is either the path of the archive, or a readable and seekable
+    file object holding the archive.
+    """
+    if isinstance(filepath, io.IOBase):
+        return _load_model_from_fileobj(
+            filepath, custom_objects, compile, safe_mode
+        )
 
     filepath = str(filepath)
     if not filepath.endswith(".keras"):
@@ -136,51 +237,138 @@ def load_model(filepath, custom_objects=None, compile=True, safe_mode=True):
             f"Received: filepath={filepath}"
         )
 
-    with file_utils.File(filepath, mode="r+b") as gfile_handle, zipfile.ZipFile(
-        gfile_handle, "r"
-    ) as zf:
+    with file_utils.File(filepath, mode="r+b") as gfile_handle:
+        return _load_model_from_fileobj(
+            gfile_handle, custom_objects, compile, safe_mode
+        )
+
+
+def _load_model_from_fileobj(fileobj, custom_objects, compile, safe_mode):
+    with zipfile.ZipFile(fileobj, "r") as zf:
         with zf.open(_CONFIG_FILENAME, "r") as f:
             config_json = f.read()
 
-        # Note: we should NOT use a custom JSON decoder. Anything that
-        # needs custom decoding must be handled in deserialize_keras_object.
-        config_dict = json.loads(config_json)
-        if not compile:
-            # Disable compilation
-            config_dict["compile_config"] = None
         # Construct the model from the configuration file in the archive.
-        with ObjectSharingScope():
-            model = deserialize_keras_object(
-                config_dict, custom_objects, safe_mode=safe_mode
-            )
-
-        all_filenames = zf.namelist()
-        if _VARS_FNAME + ".h5" in all_filenames:
-            weights_store = H5IOStore(_VARS_FNAME + ".h5", archive=zf, mode="r")
-        elif _VARS_FNAME + ".npz" in all_filenames:
-            weights_store = NpzIOStore(
-                _VARS_FNAME + ".npz", archive=zf, mode="r"
-            )
-        else:
-            raise ValueError(
-                f"Expected a {_VARS_FNAME}.h5 or {_VARS_FNAME}.npz file."
-            )
+        model = _deserialize_model(
+            config_json, custom_objects, compile=compile, safe_mode=safe_mode
+        )
 
-        if len(all_filenames) > 3:
+        weights_store = _get_weights_store(zf)
+        asset_filenames = [
+            name
+            for name in zf.namelist()
+            if name not in (_CONFIG_FILENAME, _METADATA_FILENAME)
+            and not name.startswith(_VARS_FNAME)
+        ]
+        if asset_filenames:
             asset_store = DiskIOStore(_ASSETS_DIRNAME, archive=zf, mode="r")
         else:
             asset_store = None
 
-        _load_state(
-            model,
-            weights_store=weights_store,
-            assets_store=asset_store,
-            inner_path="",
-            visited_trackables=set(),
+        try:
+            _load_state(
+                model,
+                weights_store=weights_store,
+                assets_store=asset_store,
+                inner_path="",
+                visited_trackables=set(),
+            )
+        finally:
+            weights_store.close()
+            if asset_store:
+                asset_store.close()
+    return model
+
+
+def save_model_zarr(model, filepath):
+    """Save a Keras model to a Zarr group at the given filepath.
+
+    The model configuration and metadata are stored as attributes of the
+    root group. Each variable is stored as a chunked Zarr array compressed
+    with Blosc (zstd), so that chunks are compressed independently, by
+    threads that do not hold the GIL. Assets are stored in the `assets`
+    directory of the group.
+    """
+    filepath = str(filepath)
+    if not filepath.endswith(".zarr"):
+        raise ValueError(
+            "Invalid `filepath` argument: expected a `.zarr` extension. "
+            f"Received: filepath={filepath}"
         )
-        weights_store.close()
-        if asset_store:
-            asset_store.close()
+    if not zarr.available:
+        raise ImportError(
+            "zarr must be installed in order to save a model in the Zarr "
+            "format."
+        )
+
+    if not model.built:
+        warnings.warn(
+            "You are saving a model that has not yet been built. "
+            "It might not contain any weights yet. "
+            "Consider building the model first by calling it "
+            "on some data.",
+            stacklevel=2,
+        )
+
+    config_json, metadata_json = _serialize_model(model)
+    weights_store = ZarrIOStore(filepath, mode="w")
+    weights_store.zarr_group.attrs.update(
+        {"config": config_json, "metadata": metadata_json}
+    )
+    asset_store = DiskIOStore(_ASSETS_DIRNAME, mode="w")
+
+    _save_state(
+        model,
+        weights_store=weights_store,
+        assets_store=asset_store,
+        inner_path="",
+        visited_trackables=set(),
+    )
+    weights_store.close()
+    if file_utils.listdir(asset_store.working_dir):
+        shutil.copytree(
+            asset_store.working_dir, os.path.join(filepath, _ASSETS_DIRNAME)
+        )
+    asset_store.close()
+
+
+def load_model_zarr(
+    filepath, custom_objects=None, compile=True, safe_mode=True
+):
+    """Load a Keras model saved via `save_model_zarr()`."""
+    filepath = str(filepath)
+    if not filepath.endswith(".zarr"):
+        raise ValueError(
+            "Invalid filename: expected a `.zarr` extension. "
+            f"Received: filepath={filepath}"
+        )
+    if not zarr.available:
+        raise ImportError(
+            "zarr must be installed in order to load a model saved in the "
+            "Zarr format."
+        )
+
+    weights_store = ZarrIOStore(filepath, mode="r")
+    model = _deserialize_model(
+        weights_store.zarr_group.attrs["config"],
+        custom_objects,
+        compile=compile,
+        safe_mode=safe_mode,
+    )
+    assets_path = os.path.join(filepath, _ASSETS_DIRNAME)
+    if file_utils.isdir(assets_path):
+        asset_store = DiskIOStore(assets_path, mode="r")
+    else:
+        asset_store = None
+
+    _load_state(
+        model,
+        weights_store=weights_store,
+        assets_store=asset_store,
+        inner_path="",
+        visited_trackables=set(),
+    )
+    weights_store.close()
     return model
 
 
@@ -219,25 +407,341 @@ def load_weights_only(model, filepath, skip_mismatch=False):
     if filepath.endswith(".weights.h5"):
         # TODO: download file if h5 filepath is remote
         weights_store = H5IOStore(filepath, mode="r")
+    elif filepath.endswith(".weights.h5.delta"):
+        weights_store = QuantizedDeltaIOStore(filepath, mode="r")
     elif filepath.endswith(".keras"):
         archive = zipfile.ZipFile(filepath, "r")
-        weights_store = H5IOStore(
-            _VARS_FNAME + ".h5", archive=archive, mode="r"
-        )
+        weights_store = _get_weights_store(archive)
 
-    _load_state(
+    try:
+        _load_state(
+            model,
+            weights_store=weights_store,
+            assets_store=None,
+            inner_path="",
+            skip_mismatch=skip_mismatch,
+            visited_trackables=set(),
+        )
+    finally:
+        weights_store.close()
+        if temp_dir and file_utils.exists(temp_dir):
+            file_utils.rmtree(temp_dir)
+        if archive:
+            archive.close()
+
+
+def save_weights_delta(model, filepath, delta_base=None, quantize="int8"):
+    """Save the weights of a model as a delta from a previous checkpoint
+    (.weights.h5.delta).
+
+    Each variable is encoded as 8-bit codes: its per-tensor affine
+    quantization for floating point variables when `quantize="int8"`, or
+    its raw bytes otherwise. Only the cyclic difference between these codes
+    and those of the `.weights.h5.delta` file at `delta_base` is stored,
+    DEFLATE-compressed, so that codes which did not change take up almost
+    no space.
+    """
+    filepath = str(filepath)
+    if not filepath.endswith(".weights.h5.delta"):
+        raise ValueError(
+            "Invalid `filepath` argument: expected a `.weights.h5.delta` "
+            f"extension. Received: filepath={filepath}"
+        )
+    if quantize not in ("int8", None):
+        raise ValueError(
+            "Invalid `quantize` argument. Expected one of ['int8', None]. "
+            f"Received: quantize={quantize}"
+        )
+    if delta_base is not None:
+        delta_base = str(delta_base)
+        if not delta_base.endswith(".weights.h5.delta"):
+            raise ValueError(
+                "Invalid `delta_base` argument: expected the path of a "
+                "`.weights.h5.delta` file saved with `save_weights_delta`. "
+                f"Received: delta_base={delta_base}"
+            )
+        delta_base = os.path.abspath(delta_base)
+        base_filepaths = [delta_base] + _get_weights_delta_base_filepaths(
+            delta_base
+        )
+        if os.path.abspath(filepath) in base_filepaths:
+            raise ValueError(
+                "A weights delta cannot overwrite one of its base "
+                f"checkpoints. Received: filepath={filepath}, "
+                f"base checkpoints: {base_filepaths}"
+            )
+    weights_store = QuantizedDeltaIOStore(
+        filepath, mode="w", base_filepath=delta_base, quantize=quantize
+    )
+    _save_state(
         model,
         weights_store=weights_store,
         assets_store=None,
         inner_path="",
-        skip_mismatch=skip_mismatch,
         visited_trackables=set(),
     )
     weights_store.close()
-    if temp_dir and file_utils.exists(temp_dir):
-        file_utils.rmtree(temp_dir)
-    if archive:
-        archive.close()
+
+
+def _get_weights_store(archive):
+    all_filenames = archive.namelist()
+    if _VARS_FNAME + ".h5" in all_filenames:
+        return H5IOStore(_VARS_FNAME + ".h5", archive=archive, mode="r")
+    elif _VARS_FNAME + ".npz" in all_filenames:
+        return NpzIOStore(_VARS_FNAME + ".npz", archive=archive, mode="r")
+    elif _VARS_FNAME + ".delta.json" in all_filenames:
+        return DeltaIOStore(_VARS_FNAME + ".delta", archive=archive, mode="r")
+    elif _VARS_FNAME + ".blosc2/" in all_filenames:
+        return Blosc2IOStore(_VARS_FNAME + ".blosc2", archive=archive, mode="r")
+    raise ValueError(
+        f"Expected a {_VARS_FNAME}.h5, {_VARS_FNAME}.npz, "
+        f"{_VARS_FNAME}.delta.json or {_VARS_FNAME}.blosc2 file."
+    )
+
+
+def _get_base_filepaths(filepath):
+    """Returns the paths of the chain of base checkpoints of a `.keras`
+    archive (empty for a full checkpoint)."""
+    base_filepaths = []
+    while True:
+        with file_utils.File(filepath, mode="rb") as f, zipfile.ZipFile(
+            f, "r"
+        ) as zf:
+            if _VARS_FNAME + ".delta.json" not in zf.namelist():
+                break
+            manifest = json.loads(zf.read(_VARS_FNAME + ".delta.json"))
+        filepath = _resolve_base_filepath(manifest["base_filepath"], filepath)
+        if filepath is None:
+            break
+        base_filepaths.append(filepath)
+    return base_filepaths
+
+
+def _relative_base_filepath(base_filepath, filepath):
+    """Returns the path of a base checkpoint relative to the directory of the
+    checkpoint at `filepath`, when both are local."""
+    if (
+        base_filepath is None
+        or not isinstance(filepath, str)
+        or file_utils.is_remote_path(base_filepath)
+        or file_utils.is_remote_path(filepath)
+    ):
+        return base_filepath
+    try:
+        return os.path.relpath(
+            base_filepath, os.path.dirname(os.path.abspath(filepath))
+        )
+    except ValueError:
+        # E.g. different drives on Windows.
+        return base_filepath
+
+
+def _resolve_base_filepath(base_filepath, filepath):
+    """Resolves the path of a base checkpoint recorded relative to the
+    directory of the checkpoint at `filepath`."""
+    if (
+        base_filepath is None
+        or not isinstance(filepath, str)
+        or file_utils.is_remote_path(base_filepath)
+        or file_utils.is_remote_path(filepath)
+        or os.path.isabs(base_filepath)
+    ):
+        return base_filepath
+    return os.path.normpath(
+        os.path.join(os.path.dirname(os.path.abspath(filepath)), base_filepath)
+    )
+
+
+def _load_archive_variables(filepath):
+    """Loads all the variables of a `.keras` archive.
+
+    Returns:
+        Dict `{inner_path: {key: value}}`.
+    """
+    with file_utils.File(filepath, mode="rb") as f, zipfile.ZipFile(
+        f, "r"
+    ) as zf:
+        weights_store = _get_weights_store(zf)
+        if isinstance(weights_store, (DeltaIOStore, Blosc2IOStore)):
+            variables = weights_store.contents
+        elif isinstance(weights_store, H5IOStore):
+            variables = {}
+
+            def visit(name, obj):
+                if isinstance(obj, h5py.Dataset):
+                    parent, key = posixpath.split(name)
+                    if posixpath.basename(parent) == "vars":
+                        path = posixpath.dirname(parent)
+                        variables.setdefault(path, {})[key] = obj[()]
+
+            weights_store.h5_file.visititems(visit)
+        else:
+            variables = {
+                ""
+                if path == "__root__"
+                else path: dict(weights_store.contents[path].tolist())
+                for path in weights_store.contents.files
+            }
+        weights_store.close()
+    return variables
+
+
+def _is_fixed_size(dtype):
+    """Returns whether the elements of `dtype` are fixed-size binary values,
+    i.e. neither objects nor strings (e.g. numbers or `bfloat16`)."""
+    return not dtype.hasobject and dtype.kind not in "SU" and dtype.itemsize
+
+
+def _checksum(value):
+    if not _is_fixed_size(value.dtype):
+        return None
+    data = np.ascontiguousarray(value).reshape(-1).view(np.uint8)
+    return hashlib.sha256(data).hexdigest()
+
+
+def _get_entry_dtype(entry):
+    """Returns the dtype recorded in a `DeltaIOStore` manifest entry, or
+    `None` if there is none or if it is unknown to NumPy (e.g. `bfloat16`
+    when `ml_dtypes` is not loaded)."""
+    if "dtype" not in entry:
+        return None
+    try:
+        return np.dtype(entry["dtype"])
+    except TypeError:
+        return None
+
+
+def _view_as(array, dtype):
+    """Reinterprets the bytes of `array` as `dtype`, since `.npz` and `.h5`
+    files read back dtypes unknown to them (e.g. `bfloat16`) as raw bytes."""
+    if dtype is None or array.dtype == dtype:
+        return array
+    return array.view(dtype)
+
+
+def _get_changed_indices(value, base_value):
+    """Returns the flat indices of the elements of `value` whose bits differ
+    from `base_value`, or `None` if the two cannot be compared."""
+    if (
+        base_value is None
+        or base_value.shape != value.shape
+        or not _is_fixed_size(value.dtype)
+        or not _is_fixed_size(base_value.dtype)
+        or base_value.dtype.itemsize != value.dtype.itemsize
+    ):
+        return None
+    itemsize = value.dtype.itemsize
+    bits = np.ascontiguousarray(value).view(np.uint8).reshape(-1, itemsize)
+    base_bits = (
+        np.ascontiguousarray(base_value).view(np.uint8).reshape(-1, itemsize)
+    )
+    indices = np.flatnonzero((bits != base_bits).any(axis=1))
+    if value.size < 2**32:
+        return indices.astype(np.uint32)
+    return indices.astype(np.uint64)
+
+
+def _get_weights_delta_base_filepaths(filepath):
+    """Returns the paths of the chain of base checkpoints of a
+    `.weights.h5.delta` file."""
+    base_filepaths = []
+    while True:
+        with h5py.File(filepath, "r") as f:
+            filepath = _resolve_base_filepath(
+                f.attrs.get("delta_base"), filepath
+            )
+        if filepath is None:
+            return base_filepaths
+        base_filepaths.append(filepath)
+
+
+def _read_weights_delta_codes(filepath):
+    """Reconstructs the 8-bit codes of the variables of a
+    `.weights.h5.delta` file by walking its chain of base checkpoints.
+
+    Returns:
+        Dict `{inner_path: {key: (codes, attrs)}}`.
+    """
+    with h5py.File(filepath, "r") as f:
+        base_filepath = _resolve_base_filepath(
+            f.attrs.get("delta_base"), filepath
+        )
+        base_codes = {}
+        if base_filepath is not None:
+            base_codes = _read_weights_delta_codes(base_filepath)
+        variables = {}
+
+        def visit(name, obj):
+            if isinstance(obj, h5py.Dataset):
+                parent, key = posixpath.split(name)
+                path = posixpath.dirname(parent)
+                codes = obj[()]
+                base_value = base_codes.get(path, {}).get(key)
+                if base_value is not None and base_value[0].size == codes.size:
+                    # uint8 arithmetic wraps around, i.e. is modulo 256.
+                    codes += base_value[0]
+                variables.setdefault(path, {})[key] = (codes, dict(obj.attrs))
+
+        f.visititems(visit)
+    return variables
+
+
+def _quantize_codes(value, quantize):
+    """Encodes a variable as a flat array of 8-bit codes, and the attributes
+    needed to decode it."""
+    attrs = {"dtype": value.dtype.name, "shape": np.array(value.shape)}
+    if (
+        quantize == "int8"
+        and value.dtype.kind == "f"
+        and value.size
+        and np.isfinite(value).all()
+    ):
+        # The range always includes 0, so that zeros stay exact.
+        low = min(float(value.min()), 0.0)
+        high = max(float(value.max()), 0.0)
+        scale = (high - low) / 255 or 1.0
+        zero_point = round(-low / scale)
+        codes = np.clip(np.round(value / scale) + zero_point, 0, 255)
+        attrs.update(encoding="int8", scale=scale, zero_point=zero_point)
+        return codes.astype("uint8").reshape(-1), attrs
+    attrs["encoding"] = "raw"
+    return np.ascontiguousarray(value).reshape(-1).view(np.uint8), attrs
+
+
+def _dequantize_codes(codes, attrs):
+    dtype = np.dtype(attrs["dtype"])
+    if attrs["encoding"] == "int8":
+        value = (codes.astype("float64") - attrs["zero_point"]) * attrs["scale"]
+        value = value.astype(dtype)
+    else:
+        value = codes.view(dtype)
+    return value.reshape(tuple(attrs["shape"]))
+
+
+def _serialize_model(model):
+    with ObjectSharingScope():
+        serialized_model_dict = serialize_keras_object(model)
+    config_json = json.dumps(serialized_model_dict)
+    metadata_json = json.dumps(
+        {
+            "keras_version": keras_version,
+            "date_saved": datetime.datetime.now().strftime("%Y-%m-%d@%H:%M:%S"),
+        }
+    )
+    return config_json, metadata_json
+
+
+def _deserialize_model(config_json, custom_objects, compile, safe_mode):
+    # Note: we should NOT use a custom JSON decoder. Anything that
+    # needs custom decoding must be handled in deserialize_keras_object.
+    config_dict = json.loads(config_json)
+    if not compile:
+        # Disable compilation
+        config_dict["compile_config"] = None
+    with ObjectSharingScope():
+        return deserialize_keras_object(
+            config_dict, custom_objects, safe_mode=safe_mode
+        )
 
 
 def _write_to_zip_recursively(zipfile_to_save, system_path, zip_path):
@@ -442,6 +946,121 @@ def _load_container_state(
             )
 
 
+def _open_stored_member(archive, name):
+    """Opens an uncompressed (`ZIP_STORED`) member of an archive for reading,
+    without copying its data.
+
+    The member is read through a memory map of the archive file (or through
+    the buffer of the archive, if it was loaded in a `MemoryFile`), which
+    skips the intermediate copies of `ZipFile.open()`. The CRC-32 of the
+    member is checked once, when it is opened.
+
+    Returns:
+        A `MemoryFile`, or `None` if the member is compressed or encrypted,
+        or if the archive is not backed by a local file.
+    """
+    info = archive.getinfo(name)
+    if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return None
+    if isinstance(archive.fp, MemoryFile):
+        buffer = archive.fp.getbuffer()
+        close_buffer = False
+    else:
+        try:
+            buffer = mmap.mmap(archive.fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            return None
+        close_buffer = True
+    start = info.header_offset
+    header = bytes(buffer[start : start + _ZIP_LOCAL_HEADER_SIZE])
+    if not header.startswith(_ZIP_LOCAL_HEADER_SIGNATURE):
+        if close_buffer:
+            buffer.close()
+        raise zipfile.BadZipFile(f"Bad local file header for member {name}")
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    offset = start + _ZIP_LOCAL_HEADER_SIZE + name_length + extra_length
+    member_file = MemoryFile(
+        buffer, offset=offset, size=info.file_size, close_buffer=close_buffer
+    )
+    if zlib.crc32(member_file.getbuffer()) != info.CRC:
+        member_file.close()
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {name!r}")
+    return member_file
+
+
+class MemoryFile(io.RawIOBase):
+    """Read-only, seekable file object over `size` bytes of a buffer (e.g.
+    an `mmap`), starting at `offset`.
+
+    If `close_buffer` is `True`, the buffer is closed along with the file
+    object. `name` is the path of the file the buffer was read from, if any.
+    """
+
+    def __init__(
+        self, buffer, offset=0, size=None, close_buffer=True, name=None
+    ):
+        self.name = name
+        self._buffer = buffer
+        self._close_buffer = close_buffer
+        with memoryview(buffer) as view:
+            if size is None:
+                size = len(view) - offset
+            self._view = view[offset : offset + size]
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def getbuffer(self):
+        """Returns a memoryview over the content of the file."""
+        return self._view
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._position = offset
+        return offset
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            end = len(self._view)
+        else:
+            end = min(self._position + size, len(self._view))
+        data = self._view[self._position : end].tobytes()
+        self._position += len(data)
+        return data
+
+    def readinto(self, b):
+        data = self._view[self._position : self._position + len(b)]
+        num_bytes = len(data)
+        b[:num_bytes] = data
+        self._position += num_bytes
+        return num_bytes
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+            if self._close_buffer:
+                try:
+                    self._buffer.close()
+                except BufferError:
+                    # Views of the buffer (e.g. opened with
+                    # `_open_stored_member()`) are still in use. The buffer
+                    # is freed once they are released.
+                    pass
+        super().close()
+
+
 class DiskIOStore:
     """Asset store backed by disk storage.
 
@@ -516,7 +1135,9 @@ class H5IOStore:
             if self.mode == "w":
                 self.io_file = io.BytesIO()
             else:
-                self.io_file = self.archive.open(self.root_path, "r")
+                self.io_file = _open_stored_member(
+                    self.archive, self.root_path
+                ) or self.archive.open(self.root_path, "r")
             self.h5_file = h5py.File(self.io_file, mode=self.mode)
         else:
             self.h5_file = h5py.File(root_path, mode=self.mode)
@@ -536,7 +1157,12 @@ class H5IOStore:
     def close(self):
         self.h5_file.close()
         if self.mode == "w" and self.archive:
-            self.archive.writestr(self.root_path, self.io_file.getvalue())
+            # Stream the buffer into the archive entry without the extra copy
+            # made by `getvalue()`.
+            with self.archive.open(
+                self.root_path, "w", force_zip64=True
+            ) as f, self.io_file.getbuffer() as buffer:
+                f.write(buffer)
         if self.io_file:
             self.io_file.close()
 
@@ -558,7 +1184,9 @@ class NpzIOStore:
             self.contents = {}
         else:
             if self.archive:
-                self.f = archive.open(root_path, mode="r")
+                self.f = _open_stored_member(
+                    archive, root_path
+                ) or archive.open(root_path, mode="r")
             else:
                 self.f = open(root_path, mode="rb")
             self.contents = np.load(self.f, allow_pickle=True)
@@ -591,6 +1219,361 @@ class NpzIOStore:
         self.f.close()
 
 
+class Blosc2IOStore:
+    def __init__(self, root_path, archive, mode="r"):
+        """Numerical variable store holding each variable as a separate
+        Blosc2-compressed member of the archive.
+
+        Variables are compressed with zstd (level 1) after byte shuffling,
+        which is much faster than DEFLATE and compresses floating point
+        weights better. They are stored as `{root_path}/{path}/vars/{key}`.
+        Empty and non-numeric variables, which Blosc2 cannot pack, are
+        stored as `.npy` data instead.
+        A `{root_path}/` directory entry is always written, so that the
+        format can be detected even when the model has no variables.
+
+        In read mode, all the members are read and decompressed up front, by
+        a pool of threads: Blosc2 releases the GIL while decompressing, so
+        the members are decoded concurrently.
+        """
+        if not blosc2.available:
+            raise ImportError(
+                "blosc2 must be installed in order to use the blosc2 "
+                "weights format."
+            )
+        self.root_path = root_path
+        self.archive = archive
+        self.mode = mode
+        self.contents = {}
+        # Maps each inner path to the `{key: member_name}` of its variables.
+        self.members = {}
+        if self.mode == "r":
+            prefix = self.root_path + "/"
+            for name in self.archive.namelist():
+                if not name.startswith(prefix) or name == prefix:
+                    continue
+                parent, key = posixpath.split(name[len(prefix) :])
+                path = posixpath.dirname(parent)
+                self.members.setdefault(path, {})[key] = name
+            self._read_members()
+
+    def make(self, path):
+        self.contents[path] = {}
+        return self.contents[path]
+
+    def get(self, path):
+        return self.contents.get(path, {})
+
+    def _read_members(self):
+        items = [
+            (path, key, name)
+            for path, members in self.members.items()
+            for key, name in members.items()
+        ]
+        num_workers = min(_MAX_DECODE_WORKERS, os.cpu_count() or 1)
+        with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+            values = executor.map(
+                self._read_member, [name for _, _, name in items]
+            )
+            for (path, key, _), value in zip(items, values):
+                self.contents.setdefault(path, {})[key] = value
+
+    def _read_member(self, name):
+        data = self.archive.read(name)
+        if data.startswith(_NPY_MAGIC):
+            return np.load(io.BytesIO(data), allow_pickle=False)
+        return blosc2.unpack_array2(data)
+
+    def close(self):
+        if self.mode != "w":
+            return
+        cparams = {
+            "codec": blosc2.Codec.ZSTD,
+            "clevel": 1,
+            "filters": [blosc2.Filter.SHUFFLE],
+        }
+        self.archive.writestr(self.root_path + "/", b"")
+        for path, variables in self.contents.items():
+            for key, value in variables.items():
+                value = np.asarray(value)
+                name = posixpath.join(self.root_path, path, "vars", key)
+                if value.size and value.dtype.kind in "biufc":
+                    data = blosc2.pack_array2(value, cparams=cparams)
+                else:
+                    buffer = io.BytesIO()
+                    np.save(buffer, value, allow_pickle=False)
+                    data = buffer.getvalue()
+                self.archive.writestr(
+                    name, data, compress_type=zipfile.ZIP_STORED
+                )
+
+
+class DeltaIOStore:
+    def __init__(
+        self, root_path, archive, mode="r", base_filepaths=None, filepath=None
+    ):
+        """Numerical variable store holding the changes from a base checkpoint.
+
+        In write mode, each variable is compared bitwise with its value in
+        the `.keras` archive at `base_filepaths[0]`, and only the flat
+        indices and values of the changed elements are stored.
+        `base_filepaths` is the whole chain of base checkpoints, starting
+        with the direct base. Variables for which
+        this would not be smaller are stored in full. When the chain of base
+        checkpoints would grow longer than `_MAX_DELTA_CHAIN_LENGTH`, all the
+        variables are stored in full, so that the archive becomes the new
+        base of the chain.
+
+        In read mode, the variables are reconstructed by walking the chain
+        of base checkpoints, and checked against the SHA-256 checksums
+        recorded at saving time.
+
+        `root_path` refers to the prefix of the JSON manifest (`.json`) and
+        of the arrays (`.npz`) inside the archive. `filepath` is the location
+        of the archive (by default, `archive.filename`): the path of the base
+        checkpoint is recorded relative to its directory when both are local,
+        so that chains of checkpoints can be moved together.
+        """
+        self.root_path = root_path
+        self.archive = archive
+        self.mode = mode
+        self.base_filepaths = base_filepaths or []
+        self.base_filepath = (
+            self.base_filepaths[0] if self.base_filepaths else None
+        )
+        self.filepath = filepath if filepath is not None else archive.filename
+        self.chain_length = 0
+        self.contents = {}
+        if self.mode == "r":
+            self._read()
+
+    def make(self, path):
+        self.contents[path] = {}
+        return self.contents[path]
+
+    def get(self, path):
+        return self.contents.get(path, {})
+
+    def _read(self):
+        with self.archive.open(self.root_path + ".json", "r") as f:
+            manifest = json.loads(f.read())
+        with self.archive.open(self.root_path + ".npz", "r") as f:
+            npz_file = np.load(f, allow_pickle=True)
+            arrays = {name: npz_file[name] for name in npz_file.files}
+        self.base_filepath = _resolve_base_filepath(
+            manifest["base_filepath"], self.filepath
+        )
+        self.chain_length = manifest["chain_length"]
+        base_variables = {}
+        if self.base_filepath is not None:
+            base_variables = _load_archive_variables(self.base_filepath)
+
+        for i, entry in enumerate(manifest["variables"]):
+            path, key = entry["path"], entry["key"]
+            dtype = _get_entry_dtype(entry)
+            if entry["encoding"] == "full":
+                value = _view_as(arrays[str(i)], dtype)
+            else:
+                base_value = base_variables.get(path, {}).get(key)
+                if base_value is None:
+                    raise ValueError(
+                        f"Variable '{key}' of '{path}' was not found in the "
+                        f"base checkpoint {self.base_filepath}."
+                    )
+                value = _view_as(np.array(base_value), dtype)
+                if entry["encoding"] == "sparse":
+                    value.reshape(-1)[arrays[f"{i}_indices"]] = _view_as(
+                        arrays[f"{i}_values"], dtype
+                    )
+            if _checksum(value) != entry["sha256"]:
+                raise ValueError(
+                    f"Checksum mismatch for variable '{key}' of '{path}'. "
+                    "The incremental checkpoint or its base checkpoint "
+                    f"{self.base_filepath} may have been modified."
+                )
+            self.contents.setdefault(path, {})[key] = value
+
+    def close(self):
+        if self.mode != "w":
+            return
+        base_variables = {}
+        if self.base_filepath is not None:
+            base_chain_length = len(self.base_filepaths) - 1
+            if base_chain_length < _MAX_DELTA_CHAIN_LENGTH:
+                self.chain_length = base_chain_length + 1
+                base_variables = _load_archive_variables(self.base_filepath)
+            else:
+                self.base_filepath = None
+
+        entries = []
+        arrays = {}
+        for path, variables in self.contents.items():
+            for key, value in variables.items():
+                value = np.asarray(value)
+                name = str(len(entries))
+                entry = {"path": path, "key": key, "sha256": _checksum(value)}
+                if _is_fixed_size(value.dtype):
+                    entry["dtype"] = value.dtype.name
+                indices = _get_changed_indices(
+                    value, base_variables.get(path, {}).get(key)
+                )
+                if indices is None or indices.size * (
+                    indices.itemsize + value.itemsize
+                ) >= max(value.nbytes, 1):
+                    entry["encoding"] = "full"
+                    arrays[name] = value
+                elif indices.size == 0:
+                    entry["encoding"] = "unchanged"
+                else:
+                    entry["encoding"] = "sparse"
+                    arrays[f"{name}_indices"] = indices
+                    arrays[f"{name}_values"] = value.reshape(-1)[indices]
+                entries.append(entry)
+
+        manifest = {
+            "base_filepath": _relative_base_filepath(
+                self.base_filepath, self.filepath
+            ),
+            "chain_length": self.chain_length,
+            "variables": entries,
+        }
+        self.archive.writestr(
+            self.root_path + ".json",
+            json.dumps(manifest).encode(),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+        with self.archive.open(
+            self.root_path + ".npz", "w", force_zip64=True
+        ) as f:
+            if self.base_filepath is None:
+                np.savez(f, **arrays)
+            else:
+                np.savez_compressed(f, **arrays)
+
+
+class QuantizedDeltaIOStore:
+    def __init__(
+        self, root_path, mode="r", base_filepath=None, quantize="int8"
+    ):
+        """Numerical variable store backed by HDF5, holding the 8-bit codes
+        of the variables as cyclic deltas from a base checkpoint.
+
+        `root_path` refers to the path of the `.weights.h5.delta` file on
+        disk, which stores the path of its base checkpoint (if any),
+        relative to its own directory, in the `delta_base` attribute. When
+        the chain of base checkpoints would grow longer than
+        `_MAX_DELTA_CHAIN_LENGTH`, the codes are stored as is, so that the
+        file becomes the new base of the chain.
+        """
+        self.root_path = root_path
+        self.mode = mode
+        self.base_filepath = base_filepath
+        self.quantize = quantize
+        self.contents = {}
+        if self.mode == "r":
+            for path, variables in _read_weights_delta_codes(root_path).items():
+                self.contents[path] = {
+                    key: _dequantize_codes(codes, attrs)
+                    for key, (codes, attrs) in variables.items()
+                }
+
+    def make(self, path):
+        self.contents[path] = {}
+        return self.contents[path]
+
+    def get(self, path):
+        return self.contents.get(path, {})
+
+    def close(self):
+        if self.mode != "w":
+            return
+        base_codes = {}
+        if self.base_filepath is not None:
+            base_chain_length = len(
+                _get_weights_delta_base_filepaths(self.base_filepath)
+            )
+            if base_chain_length < _MAX_DELTA_CHAIN_LENGTH:
+                base_codes = _read_weights_delta_codes(self.base_filepath)
+            else:
+                self.base_filepath = None
+
+        with h5py.File(self.root_path, "w") as f:
+            if self.base_filepath is not None:
+                f.attrs["delta_base"] = _relative_base_filepath(
+                    self.base_filepath, self.root_path
+                )
+            for path, variables in self.contents.items():
+                group = f.create_group(posixpath.join(path, "vars"))
+                for key, value in variables.items():
+                    codes, attrs = _quantize_codes(
+                        np.asarray(value), self.quantize
+                    )
+                    base_value = base_codes.get(path, {}).get(key)
+                    if (
+                        base_value is not None
+                        and base_value[0].size == codes.size
+                    ):
+                        codes = codes - base_value[0]
+                    dataset = group.create_dataset(
+                        key, data=codes, compression="gzip"
+                    )
+                    dataset.attrs.update(attrs)
+
+
+class ZarrIOStore:
+    def __init__(self, root_path, mode="r"):
+        """Numerical variable store backed by Zarr.
+
+        `root_path` refers to the path of the Zarr group. Each variable is
+        stored as a chunked array, compressed with Blosc (zstd + byte
+        shuffle). Only zarr 2.x is supported.
+        """
+        if int(zarr.__version__.split(".")[0]) >= 3:
+            raise ImportError(
+                "The Zarr format requires zarr 2.x. You can install it via "
+                f'`pip install "zarr<3"`. Received: zarr=={zarr.__version__}'
+            )
+        self.root_path = root_path
+        self.mode = mode
+        self.zarr_group = zarr.open_group(root_path, mode=mode)
+        self.contents = {}
+
+    def make(self, path):
+        self.contents[path] = {}
+        return self.contents[path]
+
+    def get(self, path):
+        vars_path = f"{path}/vars" if path else "vars"
+        if vars_path not in self.zarr_group:
+            return {}
+        return {
+            name: array[...]
+            for name, array in self.zarr_group[vars_path].arrays()
+        }
+
+    def close(self):
+        if self.mode != "w":
+            return
+        from keras_core.legacy.saving import legacy_h5_format
+
+        compressor = numcodecs.Blosc(
+            cname="zstd", clevel=1, shuffle=numcodecs.Blosc.SHUFFLE
+        )
+        for path, variables in self.contents.items():
+            vars_path = f"{path}/vars" if path else "vars"
+            group = self.zarr_group.create_group(vars_path)
+            for name, value in variables.items():
+                value = np.asarray(value)
+                group.create_dataset(
+                    name,
+                    data=value,
+                    chunks=legacy_h5_format.get_chunk_shape(
+                        value.shape, value.dtype
+                    ),
+                    compressor=compressor,
+                )
+
+
 def get_temp_dir():
     temp_dir = tempfile.mkdtemp()
     testfile = tempfile.TemporaryFile(dir=temp_dir)
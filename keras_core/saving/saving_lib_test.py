@@ -1,6 +1,8 @@
 """Tests for Keras python-based idempotent saving functions."""
+import asyncio
 import json
 import os
+import shutil
 import warnings
 import zipfile
 from pathlib import Path
@@ -411,6 +413,480 @@ class SavingTest(testing.TestCase):
         model = keras_core.saving.load_model(temp_filepath)
         self.assertAllClose(model.predict(ref_input), ref_output, atol=1e-6)
 
+    def test_zip_compression(self):
+        from keras_core.saving import saving_api
+
+        model = _get_basic_functional_model()
+        ref_input = np.random.random((2, 4))
+        ref_output = model.predict(ref_input)
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "stored.keras")
+        saving_api.save_model(model, temp_filepath)
+        with zipfile.ZipFile(temp_filepath, "r") as z:
+            compress_types = {i.filename: i.compress_type for i in z.infolist()}
+        self.assertEqual(
+            compress_types[saving_lib._CONFIG_FILENAME], zipfile.ZIP_DEFLATED
+        )
+        self.assertEqual(
+            compress_types[saving_lib._VARS_FNAME + ".h5"], zipfile.ZIP_STORED
+        )
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "deflated.keras")
+        saving_api.save_model(model, temp_filepath, compression="deflated")
+        with zipfile.ZipFile(temp_filepath, "r") as z:
+            info = z.getinfo(saving_lib._VARS_FNAME + ".h5")
+        self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+        model = saving_api.load_model(temp_filepath)
+        self.assertAllClose(model.predict(ref_input), ref_output, atol=1e-6)
+
+        with self.assertRaisesRegex(ValueError, "Invalid `compression`"):
+            saving_api.save_model(model, temp_filepath, compression="lzma")
+
+    def test_blosc2_compression(self):
+        pytest.importorskip("blosc2")
+        from keras_core.saving import saving_api
+
+        model = _get_basic_functional_model()
+        model.fit(np.random.random((4, 4)), np.random.random((4, 1)))
+        ref_input = np.random.random((2, 4))
+        ref_output = model.predict(ref_input)
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "blosc2.keras")
+        saving_api.save_model(model, temp_filepath, compression="blosc2")
+        with zipfile.ZipFile(temp_filepath, "r") as z:
+            names = z.namelist()
+        self.assertIn(
+            saving_lib._VARS_FNAME + ".blosc2/layers/dense/vars/0", names
+        )
+        self.assertNotIn(saving_lib._VARS_FNAME + ".h5", names)
+
+        loaded_model = saving_api.load_model(temp_filepath)
+        self.assertAllClose(
+            loaded_model.predict(ref_input), ref_output, atol=1e-6
+        )
+        for v_ref, v in zip(
+            model.optimizer.variables, loaded_model.optimizer.variables
+        ):
+            self.assertAllClose(v_ref, v)
+
+        loaded_model = _get_basic_functional_model()
+        loaded_model.load_weights(temp_filepath)
+        self.assertAllClose(
+            loaded_model.predict(ref_input), ref_output, atol=1e-6
+        )
+
+        # Model without any variables.
+        model = keras_core.Sequential(
+            [keras_core.Input((3,)), keras_core.layers.Activation("relu")]
+        )
+        saving_api.save_model(model, temp_filepath, compression="blosc2")
+        with zipfile.ZipFile(temp_filepath, "r") as z:
+            self.assertIn(saving_lib._VARS_FNAME + ".blosc2/", z.namelist())
+        loaded_model = saving_api.load_model(temp_filepath)
+        ref_input = np.random.random((2, 3))
+        self.assertAllClose(loaded_model.predict(ref_input), model(ref_input))
+
+    def test_save_model_to_remote_path(self):
+        temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.keras")
+        model = _get_basic_functional_model()
+        ref_input = np.random.random((2, 4))
+        ref_output = model.predict(ref_input)
+        # Mock the remote path check so that the archive is written to a
+        # local temporary file and then streamed to the target.
+        with mock.patch.object(
+            saving_lib.file_utils, "is_remote_path", return_value=True
+        ):
+            saving_lib.save_model(model, temp_filepath)
+        model = saving_lib.load_model(temp_filepath)
+        self.assertAllClose(model.predict(ref_input), ref_output, atol=1e-6)
+
+        # The temporary directories are removed if the upload fails.
+        temp_dirs = []
+        original_get_temp_dir = saving_lib.get_temp_dir
+
+        def get_temp_dir():
+            temp_dirs.append(original_get_temp_dir())
+            return temp_dirs[-1]
+
+        with mock.patch.object(
+            saving_lib.file_utils, "is_remote_path", return_value=True
+        ), mock.patch.object(
+            saving_lib, "get_temp_dir", side_effect=get_temp_dir
+        ), mock.patch.object(
+            saving_lib.shutil, "copyfileobj", side_effect=OSError("upload")
+        ):
+            with self.assertRaisesRegex(OSError, "upload"):
+                saving_lib.save_model(model, temp_filepath)
+        self.assertTrue(temp_dirs)
+        for temp_dir in temp_dirs:
+            self.assertFalse(os.path.exists(temp_dir))
+
+    def test_async_api(self):
+        model = _get_basic_functional_model()
+        ref_input = np.random.random((2, 4))
+        ref_output = model.predict(ref_input)
+        for filename in ("mymodel.keras", "mymodel.h5"):
+            temp_filepath = os.path.join(self.get_temp_dir(), filename)
+            asyncio.run(
+                keras_core.saving.save_model_async(model, temp_filepath)
+            )
+            loaded_model = asyncio.run(
+                keras_core.saving.load_model_async(temp_filepath)
+            )
+            self.assertAllClose(
+                loaded_model.predict(ref_input), ref_output, atol=1e-6
+            )
+            new_model = _get_basic_functional_model()
+            asyncio.run(
+                keras_core.saving.load_weights_async(new_model, temp_filepath)
+            )
+            self.assertAllClose(
+                new_model.predict(ref_input), ref_output, atol=1e-6
+            )
+
+    def test_zarr_format(self):
+        pytest.importorskip("zarr")
+        from keras_core.saving import saving_api
+
+        model = _get_basic_functional_model()
+        ref_input = np.random.random((2, 4))
+        ref_output = model.predict(ref_input)
+        temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.zarr")
+        saving_api.save_model(model, temp_filepath)
+        loaded_model = saving_api.load_model(temp_filepath)
+        self.assertTrue(loaded_model.compiled)
+        self.assertAllClose(
+            loaded_model.predict(ref_input), ref_output, atol=1e-6
+        )
+
+        # Assets and custom variables
+        model = ModelWithCustomSaving()
+        model(np.random.random((2, 32)))
+        model.custom_dense.assets = "Updated assets"
+        model.custom_dense.stored_variables = np.arange(10.0)
+        temp_filepath = os.path.join(self.get_temp_dir(), "custom.zarr")
+        saving_api.save_model(model, temp_filepath)
+        loaded_model = saving_api.load_model(temp_filepath)
+        self.assertEqual(loaded_model.custom_dense.assets, "Updated assets")
+        self.assertAllClose(
+            loaded_model.custom_dense.stored_variables, np.arange(10.0)
+        )
+
+        with mock.patch("zarr.__version__", "3.0.0"):
+            with self.assertRaisesRegex(ImportError, "requires zarr 2.x"):
+                saving_api.save_model(model, temp_filepath)
+
+    def test_parallel_download(self):
+        from keras_core.saving import saving_api
+
+        src_filepath = os.path.join(self.get_temp_dir(), "src.bin")
+        dst_filepath = os.path.join(self.get_temp_dir(), "dst.bin")
+        data = np.random.bytes(10000)
+        with open(src_filepath, "wb") as f:
+            f.write(data)
+        saving_api._parallel_download(
+            src_filepath, dst_filepath, num_workers=3, chunk_size=1024
+        )
+        with open(dst_filepath, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+    def test_read_file_direct(self):
+        from keras_core.saving import saving_api
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "data.bin")
+        data = np.random.bytes(3 * 4096 + 100)
+        with open(temp_filepath, "wb") as f:
+            f.write(data)
+        with saving_api._read_file_direct(temp_filepath) as f:
+            self.assertEqual(f.read(10), data[:10])
+            f.seek(-100, os.SEEK_END)
+            self.assertEqual(f.read(), data[-100:])
+            f.seek(0)
+            self.assertEqual(f.read(), data)
+
+        # Loading a model through the direct I/O path.
+        model = _get_basic_functional_model()
+        ref_input = np.random.random((2, 4))
+        ref_output = model.predict(ref_input)
+        temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.keras")
+        model.save(temp_filepath)
+        with mock.patch.object(saving_api, "_DIRECT_IO_MIN_SIZE", 0):
+            model = saving_api.load_model(temp_filepath)
+        self.assertAllClose(model.predict(ref_input), ref_output, atol=1e-6)
+
+    def test_open_stored_member(self):
+        from keras_core.saving import saving_api
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "archive.zip")
+        with zipfile.ZipFile(temp_filepath, "w") as zf:
+            zf.writestr("stored.bin", b"stored data")
+            zf.writestr(
+                "deflated.bin",
+                b"deflated data",
+                compress_type=zipfile.ZIP_DEFLATED,
+            )
+        with zipfile.ZipFile(temp_filepath, "r") as zf:
+            with saving_lib._open_stored_member(zf, "stored.bin") as f:
+                self.assertIsInstance(f, saving_lib.MemoryFile)
+                self.assertEqual(f.read(), b"stored data")
+            self.assertIsNone(
+                saving_lib._open_stored_member(zf, "deflated.bin")
+            )
+        # Archive loaded in memory.
+        with saving_api._read_file_direct(temp_filepath) as f:
+            with zipfile.ZipFile(f, "r") as zf:
+                with saving_lib._open_stored_member(zf, "stored.bin") as f:
+                    self.assertEqual(f.read(6), b"stored")
+                    f.seek(1, os.SEEK_CUR)
+                    self.assertEqual(f.read(), b"data")
+
+        # Corrupted member data.
+        with open(temp_filepath, "rb") as f:
+            content = f.read()
+        with open(temp_filepath, "wb") as f:
+            f.write(content.replace(b"stored data", b"stored dat!"))
+        with zipfile.ZipFile(temp_filepath, "r") as zf:
+            with self.assertRaisesRegex(zipfile.BadZipFile, "Bad CRC-32"):
+                saving_lib._open_stored_member(zf, "stored.bin")
+
+    def test_load_error_with_direct_io(self):
+        from keras_core.saving import saving_api
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.keras")
+        model = _get_basic_functional_model()
+        model.save(temp_filepath)
+        # The error raised while loading the weights is not masked by the
+        # release of the in-memory archive.
+        with mock.patch.object(
+            saving_api, "_DIRECT_IO_MIN_SIZE", 0
+        ), mock.patch.object(
+            keras_core.layers.Dense,
+            "load_own_variables",
+            side_effect=KeyError("kernel"),
+        ):
+            with self.assertRaises(KeyError):
+                saving_api.load_model(temp_filepath)
+
+    def test_load_model_from_remote_path(self):
+        from keras_core.saving import saving_api
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.keras")
+        model = _get_basic_functional_model()
+        ref_input = np.random.random((2, 4))
+        ref_output = model.predict(ref_input)
+        model.save(temp_filepath)
+        # Mock the remote path check so that the archive is downloaded to a
+        # local temporary directory before loading.
+        with mock.patch.object(
+            saving_api.file_utils, "is_remote_path", return_value=True
+        ), mock.patch.object(
+            saving_api,
+            "_parallel_download",
+            wraps=saving_api._parallel_download,
+        ) as mock_download:
+            model = saving_api.load_model(temp_filepath)
+            mock_download.assert_called_once()
+        self.assertAllClose(model.predict(ref_input), ref_output, atol=1e-6)
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.h5")
+        saving_api.save_model(model, temp_filepath)
+        not_a_model_filepath = os.path.join(self.get_temp_dir(), "model.bin")
+        with open(not_a_model_filepath, "wb") as f:
+            f.write(b"not a model file")
+        with mock.patch.object(
+            saving_api.file_utils, "is_remote_path", return_value=True
+        ), mock.patch.object(
+            saving_api,
+            "_parallel_download",
+            wraps=saving_api._parallel_download,
+        ) as mock_download:
+            model = saving_api.load_model(temp_filepath)
+            mock_download.assert_called_once()
+            # Unknown formats are rejected without being downloaded.
+            with self.assertRaisesRegex(
+                ValueError, "File format not supported"
+            ):
+                saving_api.load_model(not_a_model_filepath)
+            mock_download.assert_called_once()
+        self.assertAllClose(model.predict(ref_input), ref_output, atol=1e-6)
+
+    def test_incremental_checkpoints(self):
+        from keras_core.saving import saving_api
+
+        temp_dir = self.get_temp_dir()
+        model = _get_basic_functional_model()
+        model.fit(np.random.random((2, 4)), np.random.random((2, 1)))
+        ref_input = np.random.random((2, 4))
+        base_filepath = os.path.join(temp_dir, "base.keras")
+        saving_api.save_model(model, base_filepath)
+
+        # Only update a single kernel element.
+        kernel = model.layers[1].kernel
+        kernel.assign(ops.convert_to_numpy(kernel) + np.eye(4, 1))
+        ref_output = model.predict(ref_input)
+        delta_filepath = os.path.join(temp_dir, "delta.keras")
+        saving_api.save_model(model, delta_filepath, incremental=base_filepath)
+        with zipfile.ZipFile(delta_filepath, "r") as z:
+            manifest = json.loads(
+                z.read(saving_lib._VARS_FNAME + ".delta.json")
+            )
+        self.assertEqual(manifest["chain_length"], 1)
+        self.assertEqual(manifest["base_filepath"], "base.keras")
+        encodings = [entry["encoding"] for entry in manifest["variables"]]
+        self.assertIn("sparse", encodings)
+        self.assertIn("unchanged", encodings)
+        loaded_model = saving_api.load_model(delta_filepath)
+        self.assertAllClose(
+            loaded_model.predict(ref_input), ref_output, atol=1e-6
+        )
+        new_model = _get_basic_functional_model()
+        new_model.load_weights(delta_filepath)
+        self.assertAllClose(new_model.predict(ref_input), ref_output, atol=1e-6)
+
+        # The chain can be moved as a whole.
+        moved_dir = os.path.join(temp_dir, "moved")
+        os.mkdir(moved_dir)
+        for path in (base_filepath, delta_filepath):
+            shutil.copy(path, moved_dir)
+        moved_filepath = os.path.join(moved_dir, "delta.keras")
+        loaded_model = saving_api.load_model(moved_filepath)
+        self.assertAllClose(
+            loaded_model.predict(ref_input), ref_output, atol=1e-6
+        )
+        with mock.patch.object(saving_api, "_DIRECT_IO_MIN_SIZE", 0):
+            loaded_model = saving_api.load_model(moved_filepath)
+        self.assertAllClose(
+            loaded_model.predict(ref_input), ref_output, atol=1e-6
+        )
+
+        # Chain a second incremental checkpoint.
+        kernel.assign(ops.convert_to_numpy(kernel) * 2.0)
+        ref_output = model.predict(ref_input)
+        delta_2_filepath = os.path.join(temp_dir, "delta_2.keras")
+        saving_api.save_model(
+            model, delta_2_filepath, incremental=delta_filepath
+        )
+        loaded_model = saving_api.load_model(delta_2_filepath)
+        self.assertAllClose(
+            loaded_model.predict(ref_input), ref_output, atol=1e-6
+        )
+
+        # Once the chain is too long, a full checkpoint is saved.
+        anchor_filepath = os.path.join(temp_dir, "anchor.keras")
+        with mock.patch.object(saving_lib, "_MAX_DELTA_CHAIN_LENGTH", 2):
+            saving_api.save_model(
+                model, anchor_filepath, incremental=delta_2_filepath
+            )
+        with zipfile.ZipFile(anchor_filepath, "r") as z:
+            manifest = json.loads(
+                z.read(saving_lib._VARS_FNAME + ".delta.json")
+            )
+        self.assertIsNone(manifest["base_filepath"])
+        self.assertEqual(manifest["chain_length"], 0)
+        loaded_model = saving_api.load_model(anchor_filepath)
+        self.assertAllClose(
+            loaded_model.predict(ref_input), ref_output, atol=1e-6
+        )
+
+        with self.assertRaisesRegex(ValueError, "cannot overwrite one of"):
+            saving_api.save_model(
+                model, base_filepath, incremental=delta_2_filepath
+            )
+        with self.assertRaisesRegex(ValueError, "not supported for"):
+            saving_api.save_model(
+                model,
+                os.path.join(temp_dir, "model.h5"),
+                incremental=base_filepath,
+            )
+        with self.assertRaisesRegex(ValueError, "do not support"):
+            saving_api.save_model(
+                model,
+                os.path.join(temp_dir, "blosc2.keras"),
+                compression="blosc2",
+                incremental=base_filepath,
+            )
+
+    def test_incremental_checkpoints_bfloat16(self):
+        from keras_core.saving import saving_api
+
+        temp_dir = self.get_temp_dir()
+        model = keras_core.Sequential(
+            [
+                keras_core.Input((4,)),
+                keras_core.layers.Dense(3, dtype="bfloat16"),
+            ]
+        )
+        base_filepath = os.path.join(temp_dir, "base.keras")
+        saving_api.save_model(model, base_filepath)
+
+        kernel = model.layers[0].kernel
+        value = ops.convert_to_numpy(kernel)
+        value[0, 0] += 1.0
+        kernel.assign(value)
+        delta_filepath = os.path.join(temp_dir, "delta.keras")
+        saving_api.save_model(model, delta_filepath, incremental=base_filepath)
+        with zipfile.ZipFile(delta_filepath, "r") as z:
+            manifest = json.loads(
+                z.read(saving_lib._VARS_FNAME + ".delta.json")
+            )
+        encodings = [entry["encoding"] for entry in manifest["variables"]]
+        self.assertEqual(encodings, ["sparse", "unchanged"])
+        for entry in manifest["variables"]:
+            self.assertEqual(entry["dtype"], "bfloat16")
+            self.assertIsNotNone(entry["sha256"])
+
+        loaded_model = saving_api.load_model(delta_filepath)
+        loaded_kernel = ops.convert_to_numpy(loaded_model.layers[0].kernel)
+        self.assertEqual(loaded_kernel.dtype, value.dtype)
+        self.assertEqual(loaded_kernel.tobytes(), value.tobytes())
+
+    def test_weights_delta(self):
+        from keras_core.saving import saving_api
+
+        temp_dir = self.get_temp_dir()
+        model = _get_basic_functional_model()
+        model.fit(np.random.random((4, 4)), np.random.random((4, 1)))
+        base_filepath = os.path.join(temp_dir, "base.weights.h5.delta")
+        delta_filepath = os.path.join(temp_dir, "model.weights.h5.delta")
+        lossless_filepath = os.path.join(temp_dir, "lossless.weights.h5.delta")
+        saving_api.save_model(model, base_filepath)
+        model.layers[1].bias.assign(model.layers[1].bias + 1.0)
+        saving_api.save_model(model, delta_filepath, delta_base=base_filepath)
+        saving_api.save_model(
+            model, lossless_filepath, delta_base=delta_filepath, quantize=None
+        )
+
+        h5py = pytest.importorskip("h5py")
+        with h5py.File(delta_filepath, "r") as f:
+            self.assertEqual(f.attrs["delta_base"], "base.weights.h5.delta")
+
+        loaded_model = _get_basic_functional_model()
+        loaded_model.load_weights(delta_filepath)
+        for w_ref, w in zip(model.weights, loaded_model.weights):
+            self.assertAllClose(w_ref, w, atol=0.02)
+        loaded_model.load_weights(lossless_filepath)
+        for w_ref, w in zip(model.weights, loaded_model.weights):
+            self.assertAllClose(w_ref, w, atol=0)
+
+        with self.assertRaisesRegex(ValueError, "cannot overwrite one of"):
+            saving_api.save_model(
+                model, base_filepath, delta_base=delta_filepath
+            )
+        with self.assertRaisesRegex(ValueError, "Invalid `quantize`"):
+            saving_api.save_model(model, base_filepath, quantize="int4")
+        with self.assertRaisesRegex(ValueError, "not supported for"):
+            saving_api.save_model(
+                model,
+                os.path.join(temp_dir, "model.keras"),
+                delta_base=base_filepath,
+            )
+        weights_filepath = os.path.join(temp_dir, "model.weights.h5")
+        model.save_weights(weights_filepath)
+        with self.assertRaisesRegex(ValueError, "Invalid `delta_base`"):
+            saving_api.save_model(
+                model, delta_filepath, delta_base=weights_filepath
+            )
+
     def test_save_load_weights_only(self):
         temp_filepath = Path(
             os.path.join(self.get_temp_dir(), "mymodel.weights.h5")
@@ -454,6 +930,94 @@ class SavingTest(testing.TestCase):
         model = saving_lib.load_model(temp_filepath, compile=False)
         self.assertEqual(model.compiled, False)
 
+    def test_extension_dispatch(self):
+        from keras_core.saving import saving_api
+
+        self.assertEqual(
+            saving_api._get_handler(
+                saving_api._WEIGHTS_DISPATCH, "model.weights.h5", ".h5"
+            ),
+            (".weights.h5", saving_api._load_weights_v3),
+        )
+        self.assertEqual(
+            saving_api._get_handler(
+                saving_api._WEIGHTS_DISPATCH, "model.h5", ".h5"
+            ),
+            (".h5", saving_api._load_weights_h5),
+        )
+        # Compound extensions without a handler fall back to the last one.
+        self.assertEqual(
+            saving_api._get_handler(
+                saving_api._SAVE_DISPATCH, "model.weights.h5", ".h5"
+            ),
+            (".h5", saving_api._save_h5),
+        )
+        self.assertEqual(
+            saving_api._get_handler(
+                saving_api._SAVE_DISPATCH, "model.weights.h5.delta", ".delta"
+            ),
+            (".weights.h5.delta", saving_api._save_weights_delta),
+        )
+        self.assertEqual(
+            saving_api._get_handler(
+                saving_api._SAVE_DISPATCH, "model.npz", ".npz"
+            ),
+            (None, None),
+        )
+
+        # Extensions can be registered without changing the saving API.
+        temp_filepath = os.path.join(self.get_temp_dir(), "model.custom")
+        model = _get_basic_functional_model()
+        handler = mock.Mock()
+        with mock.patch.dict(saving_api._SAVE_DISPATCH):
+            saving_api._register_handlers(
+                saving_api._SAVE_DISPATCH, {".custom": handler}
+            )
+            saving_api.save_model(model, temp_filepath)
+        handler.assert_called_once_with(model, temp_filepath, True)
+        self.assertNotIn(".custom", saving_api._SAVE_DISPATCH)
+
+    def test_save_without_overwrite(self):
+        temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.keras")
+        model = _get_basic_functional_model()
+        # The existence of the file is not checked when overwriting.
+        with mock.patch("os.path.exists", wraps=os.path.exists) as exists:
+            model.save(temp_filepath)
+        self.assertNotIn(mock.call(temp_filepath), exists.call_args_list)
+        os.remove(temp_filepath)
+
+        model.save(temp_filepath, overwrite=False)
+        self.assertIsInstance(
+            saving_lib.load_model(temp_filepath), keras_core.Model
+        )
+
+        mtime = os.path.getmtime(temp_filepath)
+        with mock.patch(
+            "keras_core.utils.io_utils.ask_to_proceed_with_overwrite",
+            return_value=False,
+        ) as ask:
+            model.save(temp_filepath, overwrite=False)
+        ask.assert_called_once_with(temp_filepath)
+        self.assertEqual(os.path.getmtime(temp_filepath), mtime)
+
+        with mock.patch(
+            "keras_core.utils.io_utils.ask_to_proceed_with_overwrite",
+            return_value=True,
+        ):
+            model.save(temp_filepath, overwrite=False)
+        self.assertIsInstance(
+            saving_lib.load_model(temp_filepath), keras_core.Model
+        )
+
+        # The created file is removed if saving fails.
+        temp_filepath = os.path.join(self.get_temp_dir(), "failed.keras")
+        with mock.patch.object(
+            saving_lib, "save_model", side_effect=RuntimeError("failed")
+        ):
+            with self.assertRaisesRegex(RuntimeError, "failed"):
+                model.save(temp_filepath, overwrite=False)
+        self.assertFalse(os.path.exists(temp_filepath))
+
     # def test_overwrite(self):
     #     temp_filepath = os.path.join(self.get_temp_dir(), "mymodel.keras")
     #     model = _get_basic_functional_model()
@@ -555,6 +1119,14 @@ class SavingTest(testing.TestCase):
         ):
             _ = saving_api.load_model(temp_filepath)
 
+        temp_filepath = os.path.join(self.get_temp_dir(), "not_a_zip.keras")
+        with open(temp_filepath, "w") as f:
+            f.write("not a zip file")
+        with self.assertRaisesRegex(
+            ValueError, "Please ensure the file is an accessible"
+        ):
+            _ = saving_api.load_model(temp_filepath)
+
         temp_filepath = os.path.join(self.get_temp_dir(), "my_saved_model")
         with self.assertRaisesRegex(ValueError, "File format not supported"):
             _ = saving_api.load_model(temp_filepath)
@@ -40,3 +40,7 @@ tensorflow = LazyModule("tensorflow")
 gfile = LazyModule("tensorflow.io.gfile", pip_name="tensorflow")
 tensorflow_io = LazyModule("tensorflow_io")
 scipy = LazyModule("scipy")
+h5py = LazyModule("h5py")
+zarr = LazyModule("zarr")
+numcodecs = LazyModule("numcodecs")
+blosc2 = LazyModule("blosc2")